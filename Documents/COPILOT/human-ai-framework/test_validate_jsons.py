@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Differential tests for validate-jsons.py
+Checks the hand-written validators against jsonschema on SCHEMAS
+Run: python -m unittest test_validate_jsons.py
+"""
+
+import copy
+import importlib.util
+import random
+import unittest
+from pathlib import Path
+
+import jsonschema
+
+_SPEC = importlib.util.spec_from_file_location(
+    "validate_jsons", Path(__file__).with_name("validate-jsons.py")
+)
+validate_jsons = importlib.util.module_from_spec(_SPEC)
+_SPEC.loader.exec_module(validate_jsons)
+
+SECURITY = {
+    "exclusiveAccess": True,
+    "dataSharing": "PROHIBITED",
+    "accessLevel": "HUMAN-AI-FRAMEWORK-ONLY"
+}
+
+# Valid documents per schema type, each covering every declared property
+SEEDS = {
+    "objectives": {
+        "spaceName": "001-HUMAN-AI-FRAMEWORK",
+        "compilationId": "weekly-20251018",
+        "lastUpdated": "2025-10-18T10:02:28Z",
+        "sources": [
+            {"space": "research", "file": "objectives.json", "checksum": "abc123"},
+            {"space": "work", "file": "objectives.json", "checksum": "def456"}
+        ],
+        "objectives": {"primary": ["ship"]},
+        "security": SECURITY
+    },
+    "report": {
+        "compilationId": "weekly-20251018",
+        "spaceName": "001-HUMAN-AI-FRAMEWORK",
+        "weeklyFolder": "weekly-20251018",
+        "startTime": "2025-10-18T10:00:00Z",
+        "endTime": "2025-10-18T10:05:00Z",
+        "summary": {
+            "totalFilesCompiled": 12,
+            "totalErrors": 0,
+            "spacesCovered": ["research", "work"],
+            "fileTypes": {"json": 12}
+        },
+        "security": SECURITY
+    },
+    "config": {
+        "space": "001-HUMAN-AI-FRAMEWORK",
+        "version": "1.0.0",
+        "lastModified": "2025-10-18"
+    }
+}
+
+# Replacement values spanning every JSON type, plus edge cases the schemas care about
+REPLACEMENTS = [
+    None, True, False, 0, 1, -1, 1.0, -2.0, 2.5, "", "text",
+    "001-HUMAN-AI-FRAMEWORK", "001-HUMAN-AI-FRAMEWORK-extra", "PROHIBITED",
+    "HUMAN-AI-FRAMEWORK-ONLY", [], ["x"], [1], {}, {"space": "x"}
+]
+
+MUTATIONS_PER_TYPE = 4000
+
+
+def _containers(doc, path=()):
+    """Yield (path, container) for every dict and list in doc"""
+    yield path, doc
+    items = doc.items() if isinstance(doc, dict) else enumerate(doc)
+    for key, value in items:
+        if isinstance(value, (dict, list)):
+            yield from _containers(value, path + (key,))
+
+
+def _mutate(doc, rng):
+    """Apply one to three random edits: delete, replace or add a member"""
+    doc = copy.deepcopy(doc)
+    for _ in range(rng.randint(1, 3)):
+        if not isinstance(doc, dict):
+            break
+        _, container = rng.choice(list(_containers(doc)))
+        keys = list(container) if isinstance(container, dict) else list(range(len(container)))
+        action = rng.random()
+        if keys and action < 0.3:
+            del container[rng.choice(keys)]
+        elif keys and action < 0.85:
+            container[rng.choice(keys)] = copy.deepcopy(rng.choice(REPLACEMENTS))
+        elif isinstance(container, dict):
+            container[rng.choice(["extra", "security", "summary", "sources"])] = copy.deepcopy(rng.choice(REPLACEMENTS))
+        else:
+            container.append(copy.deepcopy(rng.choice(REPLACEMENTS)))
+    if rng.random() < 0.02:
+        doc = copy.deepcopy(rng.choice(REPLACEMENTS))
+    return doc
+
+
+class HandwrittenValidatorTests(unittest.TestCase):
+    """The hand-written validators must agree with jsonschema on SCHEMAS"""
+
+    def assert_agrees(self, schema_type, doc):
+        reference = jsonschema.Draft202012Validator(validate_jsons.SCHEMAS[schema_type], format_checker=None)
+        expected = {error.message for error in reference.iter_errors(doc)}
+        try:
+            validate_jsons._VALIDATE[schema_type](doc)
+        except validate_jsons.SchemaError as e:
+            self.assertIn(e.message, expected, f"{schema_type}: {doc!r}")
+        else:
+            self.assertEqual(expected, set(), f"{schema_type}: {doc!r}")
+
+    def test_seeds_are_valid(self):
+        for schema_type, seed in SEEDS.items():
+            with self.subTest(schema_type=schema_type):
+                jsonschema.Draft202012Validator(validate_jsons.SCHEMAS[schema_type]).validate(seed)
+                validate_jsons._VALIDATE[schema_type](seed)
+
+    def test_mutated_documents(self):
+        for schema_type, seed in SEEDS.items():
+            rng = random.Random(schema_type)
+            for _ in range(MUTATIONS_PER_TYPE):
+                self.assert_agrees(schema_type, _mutate(seed, rng))
+
+    def test_every_schema_type_is_handwritten(self):
+        self.assertEqual(set(validate_jsons.SCHEMAS), set(SEEDS))
+        for schema_type in SEEDS:
+            self.assertIsNot(validate_jsons._VALIDATE[schema_type], validate_jsons._VALIDATE["generic"])
+
+
+if __name__ == "__main__":
+    unittest.main()
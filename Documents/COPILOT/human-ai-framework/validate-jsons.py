@@ -8,19 +8,61 @@ Security Level: EXCLUSIVE - HUMAN-AI-FRAMEWORK ONLY
 import json
 import jsonschema
 import os
+import re
 import sys
 import hashlib
+import shutil
+import contextlib
+import mmap
+import time
+from collections import Counter, deque
 from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Tuple, Any
 
-# Schema definitions for different file types
+try:
+    import fastjsonschema
+except ImportError:
+    fastjsonschema = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Folders with at least this many files are validated in worker processes
+PARALLEL_MIN_FILES = 64
+
+# Upper bound on in-memory validation log entries
+VALIDATION_LOG_MAXLEN = 100_000
+
+# Only entries at these levels are kept for the report; INFO is just counted
+REPORTED_LOG_LEVELS = frozenset({"WARN", "ERROR"})
+
+# Skip access-time updates when mapping files (Linux only)
+_O_NOATIME = getattr(os, "O_NOATIME", 0)
+
+# Security block shared by schemas that carry one
+SECURITY_SCHEMA = {
+    "type": "object",
+    "required": ["exclusiveAccess", "dataSharing", "accessLevel"],
+    "properties": {
+        "exclusiveAccess": {"type": "boolean", "enum": [True]},
+        "dataSharing": {"type": "string", "enum": ["PROHIBITED"]},
+        "accessLevel": {"type": "string", "enum": ["HUMAN-AI-FRAMEWORK-ONLY"]}
+    }
+}
+
+# Schema definitions for different file types. These are the source of truth:
+# the hand-written validators below take their required keys, enums and name
+# pattern from here, and test_validate_jsons.py checks them against jsonschema
 SCHEMAS = {
     "objectives": {
         "type": "object",
         "required": ["spaceName", "compilationId", "lastUpdated"],
         "properties": {
-            "spaceName": {"type": "string"},
+            "spaceName": {"type": "string", "pattern": "^001-HUMAN-AI-FRAMEWORK"},
             "compilationId": {"type": "string"},
             "lastUpdated": {"type": "string", "format": "date-time"},
             "sources": {
@@ -35,7 +77,8 @@ SCHEMAS = {
                     }
                 }
             },
-            "objectives": {"type": "object"}
+            "objectives": {"type": "object"},
+            "security": SECURITY_SCHEMA
         }
     },
     "report": {
@@ -43,7 +86,7 @@ SCHEMAS = {
         "required": ["compilationId", "spaceName", "weeklyFolder", "summary"],
         "properties": {
             "compilationId": {"type": "string"},
-            "spaceName": {"type": "string", "enum": ["001-HUMAN-AI-FRAMEWORK"]},
+            "spaceName": {"type": "string", "enum": ["001-HUMAN-AI-FRAMEWORK"], "pattern": "^001-HUMAN-AI-FRAMEWORK"},
             "weeklyFolder": {"type": "string"},
             "startTime": {"type": "string", "format": "date-time"},
             "endTime": {"type": "string", "format": "date-time"},
@@ -57,15 +100,7 @@ SCHEMAS = {
                     "fileTypes": {"type": "object"}
                 }
             },
-            "security": {
-                "type": "object",
-                "required": ["exclusiveAccess", "dataSharing", "accessLevel"],
-                "properties": {
-                    "exclusiveAccess": {"type": "boolean", "enum": [True]},
-                    "dataSharing": {"type": "string", "enum": ["PROHIBITED"]},
-                    "accessLevel": {"type": "string", "enum": ["HUMAN-AI-FRAMEWORK-ONLY"]}
-                }
-            }
+            "security": SECURITY_SCHEMA
         }
     },
     "config": {
@@ -78,6 +113,338 @@ SCHEMAS = {
     }
 }
 
+_GENERIC_SCHEMA = {"type": "object"}
+
+# Only generic files go through a schema library; the known types use the
+# hand-written validators below. Built once at import; date-time formats are
+# not checked, so no format checker is attached.
+if fastjsonschema is not None:
+    _validate_generic = fastjsonschema.compile(_GENERIC_SCHEMA, use_default=False, use_formats=False)
+    _SCHEMA_ERRORS = (fastjsonschema.JsonSchemaValueException,)
+else:
+    _validate_generic = jsonschema.Draft202012Validator(_GENERIC_SCHEMA, format_checker=None).validate
+    _SCHEMA_ERRORS = (jsonschema.ValidationError,)
+
+class SchemaError(Exception):
+    """Schema violation raised by the hand-written validators"""
+    
+    def __init__(self, path: List, message: str, value: Any = None):
+        super().__init__(message)
+        self.path = path
+        self.message = message
+        self.value = value
+
+# Hand-written equivalents of SCHEMAS for the known file types. The schemas
+# are fixed, so straight-line checks replace a generic schema walk. Error
+# messages follow jsonschema's wording.
+# Required keys are kept in schema order (for error messages) alongside a
+# frozenset for the subset test; enum values are interned once at import.
+_OBJECTIVES_PROPERTIES = SCHEMAS["objectives"]["properties"]
+_REPORT_PROPERTIES = SCHEMAS["report"]["properties"]
+_SECURITY_PROPERTIES = SECURITY_SCHEMA["properties"]
+
+_OBJECTIVES_REQUIRED = tuple(SCHEMAS["objectives"]["required"])
+_SOURCE_REQUIRED = tuple(_OBJECTIVES_PROPERTIES["sources"]["items"]["required"])
+_REPORT_REQUIRED = tuple(SCHEMAS["report"]["required"])
+_SUMMARY_REQUIRED = tuple(_REPORT_PROPERTIES["summary"]["required"])
+_SECURITY_REQUIRED = tuple(SECURITY_SCHEMA["required"])
+_OBJECTIVES_REQUIRED_SET = frozenset(_OBJECTIVES_REQUIRED)
+_SOURCE_REQUIRED_SET = frozenset(_SOURCE_REQUIRED)
+_REPORT_REQUIRED_SET = frozenset(_REPORT_REQUIRED)
+_SUMMARY_REQUIRED_SET = frozenset(_SUMMARY_REQUIRED)
+_SECURITY_REQUIRED_SET = frozenset(_SECURITY_REQUIRED)
+
+def _interned_enum(prop: Dict) -> List:
+    return [sys.intern(option) if isinstance(option, str) else option for option in prop["enum"]]
+
+_SPACE_NAME_ENUM = _interned_enum(_REPORT_PROPERTIES["spaceName"])
+_DATA_SHARING_ENUM = _interned_enum(_SECURITY_PROPERTIES["dataSharing"])
+_ACCESS_LEVEL_ENUM = _interned_enum(_SECURITY_PROPERTIES["accessLevel"])
+_EXCLUSIVE_ACCESS_ENUM = _interned_enum(_SECURITY_PROPERTIES["exclusiveAccess"])
+# Both schemas anchor spaceName with the same "^<prefix>" pattern
+_SPACE_NAME_PREFIX = _OBJECTIVES_PROPERTIES["spaceName"]["pattern"].removeprefix("^")
+
+# Canonical (key, value) pairs of a compliant security section; each
+# security property has a single allowed value
+_REQUIRED_SEC = frozenset(
+    (key, prop["enum"][0]) for key, prop in _SECURITY_PROPERTIES.items()
+)
+
+# Schema types whose schema already enforces the security constraints
+_SECURITY_ENFORCED_BY_SCHEMA = frozenset({"objectives", "report"})
+
+def _fail_type(value: Any, json_type: str, path: List):
+    raise SchemaError(path, f"{value!r} is not of type {json_type!r}", value)
+
+def _check_object(value: Any, path: List) -> None:
+    if not isinstance(value, dict):
+        _fail_type(value, "object", path)
+
+def _check_required(data: Dict, required: Tuple[str, ...], required_set: frozenset, path: List) -> None:
+    if not data.keys() >= required_set:
+        missing = next(key for key in required if key not in data)
+        raise SchemaError(path, f"{missing!r} is a required property", data)
+
+def _check_strings(data: Dict, keys: Tuple[str, ...], path: List) -> None:
+    for key in keys:
+        if key in data and not isinstance(data[key], str):
+            _fail_type(data[key], "string", path + [key])
+
+def _check_enum(value: Any, allowed: List, path: List) -> None:
+    # Compare types too so that 1 does not match True
+    if not any(value == option and type(value) is type(option) for option in allowed):
+        raise SchemaError(path, f"{value!r} is not one of {allowed!r}", value)
+
+def _check_count(value: Any, path: List) -> None:
+    """Non-negative JSON integer (jsonschema accepts integral floats)"""
+    if isinstance(value, bool) or not (
+        isinstance(value, int) or (isinstance(value, float) and value.is_integer())
+    ):
+        _fail_type(value, "integer", path)
+    if value < 0:
+        raise SchemaError(path, f"{value!r} is less than the minimum of 0", value)
+
+def _check_space_prefix(value: str, path: List) -> None:
+    if not value.startswith(_SPACE_NAME_PREFIX):
+        raise SchemaError(path, f"{value!r} does not match {'^' + _SPACE_NAME_PREFIX!r}", value)
+
+def _check_security(security: Any) -> None:
+    _check_object(security, ["security"])
+    _check_required(security, _SECURITY_REQUIRED, _SECURITY_REQUIRED_SET, ["security"])
+    if "exclusiveAccess" in security:
+        value = security["exclusiveAccess"]
+        if not isinstance(value, bool):
+            _fail_type(value, "boolean", ["security", "exclusiveAccess"])
+        _check_enum(value, _EXCLUSIVE_ACCESS_ENUM, ["security", "exclusiveAccess"])
+    _check_strings(security, ("dataSharing", "accessLevel"), ["security"])
+    if "dataSharing" in security:
+        _check_enum(security["dataSharing"], _DATA_SHARING_ENUM, ["security", "dataSharing"])
+    if "accessLevel" in security:
+        _check_enum(security["accessLevel"], _ACCESS_LEVEL_ENUM, ["security", "accessLevel"])
+
+def _validate_objectives(data: Any) -> None:
+    _check_object(data, [])
+    _check_required(data, _OBJECTIVES_REQUIRED, _OBJECTIVES_REQUIRED_SET, [])
+    _check_strings(data, _OBJECTIVES_REQUIRED, [])
+    _check_space_prefix(data["spaceName"], ["spaceName"])
+    
+    if "sources" in data:
+        sources = data["sources"]
+        if not isinstance(sources, list):
+            _fail_type(sources, "array", ["sources"])
+        for index, source in enumerate(sources):
+            path = ["sources", index]
+            _check_object(source, path)
+            _check_required(source, _SOURCE_REQUIRED, _SOURCE_REQUIRED_SET, path)
+            _check_strings(source, _SOURCE_REQUIRED, path)
+    
+    if "objectives" in data:
+        _check_object(data["objectives"], ["objectives"])
+    
+    if "security" in data:
+        _check_security(data["security"])
+
+def _validate_report(data: Any) -> None:
+    _check_object(data, [])
+    _check_required(data, _REPORT_REQUIRED, _REPORT_REQUIRED_SET, [])
+    _check_strings(data, ("compilationId", "spaceName"), [])
+    if "spaceName" in data:
+        _check_enum(data["spaceName"], _SPACE_NAME_ENUM, ["spaceName"])
+        _check_space_prefix(data["spaceName"], ["spaceName"])
+    _check_strings(data, ("weeklyFolder", "startTime", "endTime"), [])
+    
+    if "summary" in data:
+        summary = data["summary"]
+        _check_object(summary, ["summary"])
+        _check_required(summary, _SUMMARY_REQUIRED, _SUMMARY_REQUIRED_SET, ["summary"])
+        for key in _SUMMARY_REQUIRED:
+            if key in summary:
+                _check_count(summary[key], ["summary", key])
+        if "spacesCovered" in summary:
+            spaces = summary["spacesCovered"]
+            if not isinstance(spaces, list):
+                _fail_type(spaces, "array", ["summary", "spacesCovered"])
+            for index, space in enumerate(spaces):
+                if not isinstance(space, str):
+                    _fail_type(space, "string", ["summary", "spacesCovered", index])
+        if "fileTypes" in summary:
+            _check_object(summary["fileTypes"], ["summary", "fileTypes"])
+    
+    if "security" in data:
+        _check_security(data["security"])
+
+def _validate_config(data: Any) -> None:
+    _check_object(data, [])
+    _check_strings(data, ("space", "version", "lastModified"), [])
+
+_HANDWRITTEN = {
+    "objectives": _validate_objectives,
+    "report": _validate_report,
+    "config": _validate_config,
+}
+
+_VALIDATE = {**_HANDWRITTEN, "generic": _validate_generic}
+
+# Schema type tags in priority order; each lookahead scans the whole name
+# so "objectives" wins over "report", which wins over "config"
+_CLASSIFY_RE = re.compile(
+    r"(?=.*(?P<objectives>objectives))|(?=.*(?P<report>report))|(?=.*(?P<config>config))"
+)
+
+def _schema_error_details(error: Exception) -> Tuple[str, List, Any]:
+    """Normalize a schema error to (message, path, failed value)"""
+    if isinstance(error, SchemaError):
+        return error.message, list(error.path), error.value
+    if isinstance(error, jsonschema.ValidationError):
+        return error.message, list(error.absolute_path), error.instance
+    # fastjsonschema paths start with the root name "data"
+    return error.message, list(error.path[1:]), error.value
+
+# Last formatted second: [epoch seconds, ISO string without microseconds]
+_TS_CACHE = [None, ""]
+
+def _format_timestamp_ns(timestamp_ns: int) -> str:
+    """Format a time.time_ns() value like datetime.now().isoformat()"""
+    seconds, nanoseconds = divmod(timestamp_ns, 1_000_000_000)
+    if seconds != _TS_CACHE[0]:
+        _TS_CACHE[:] = [seconds, datetime.fromtimestamp(seconds).isoformat()]
+    
+    # isoformat() omits the fraction when microseconds are zero
+    microseconds = nanoseconds // 1000
+    if microseconds:
+        return f"{_TS_CACHE[1]}.{microseconds:06d}"
+    return _TS_CACHE[1]
+
+def _loads(raw: Any) -> Any:
+    """Parse JSON from bytes or a buffer, using orjson when available"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(bytes(raw))
+
+@contextlib.contextmanager
+def _map_file(path_str: str):
+    """Map a file read-only, yielding (buffer, stat); empty files yield b''"""
+    try:
+        fd = os.open(path_str, os.O_RDONLY | _O_NOATIME)
+    except PermissionError:
+        if not _O_NOATIME:
+            raise
+        # O_NOATIME is only permitted on files we own
+        fd = os.open(path_str, os.O_RDONLY)
+    
+    try:
+        st = os.fstat(fd)
+        if not st.st_size:
+            yield b"", st
+            return
+        
+        with mmap.mmap(fd, st.st_size, access=mmap.ACCESS_READ) as mapped:
+            view = memoryview(mapped)
+            try:
+                yield view, st
+            finally:
+                view.release()
+    finally:
+        os.close(fd)
+
+def _dumps_line(obj: Any) -> bytes:
+    """Serialize to a single newline-terminated JSON line for JSONL output"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(obj) + "\n").encode('utf-8')
+
+def _dumps_indented(obj: Any) -> bytes:
+    """Serialize to indented JSON bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode('utf-8')
+
+def _classify(file_path: Path) -> str:
+    """Determine schema type from file name"""
+    match = _CLASSIFY_RE.match(file_path.name.lower())
+    return match.lastgroup if match else "generic"
+
+def _safe_preview(data: Any, max_length: int = 200) -> str:
+    """Get safe preview of data for logging (no sensitive info exposure)"""
+    try:
+        if orjson is not None:
+            # Truncate the encoded bytes before decoding
+            encoded = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+            if len(encoded) > max_length:
+                return encoded[:max_length].decode('utf-8', errors='ignore') + "..."
+            return encoded.decode('utf-8')
+        
+        preview = json.dumps(data, indent=2)
+        if len(preview) > max_length:
+            preview = preview[:max_length] + "..."
+        return preview
+    except:
+        return str(type(data))
+
+def _validate_one(path_str: str) -> Tuple[bool, Dict, Any]:
+    """
+    Parse, schema-validate and checksum a single JSON file.
+    Module-level and side-effect free so it can run in worker processes;
+    logging and counting happen in the parent.
+    """
+    file_path = Path(path_str)
+    try:
+        # One mapping serves both the parser and the checksum
+        # (orjson.JSONDecodeError subclasses json.JSONDecodeError)
+        with _map_file(path_str) as (buffer, st):
+            data = _loads(buffer)
+            
+            # Validate against the schema type's validator
+            schema_type = _classify(file_path)
+            _VALIDATE[schema_type](data)
+            
+            checksum = hashlib.sha256(buffer).hexdigest()
+        
+        result = {
+            "file": path_str,
+            "valid": True,
+            "schema_type": schema_type,
+            "checksum": checksum,
+            "size_bytes": st.st_size
+        }
+        
+        # Only types without schema-enforced security need the data in the
+        # parent; skip pickling the rest back from worker processes
+        if schema_type in _SECURITY_ENFORCED_BY_SCHEMA:
+            data = None
+        return True, result, data
+        
+    except json.JSONDecodeError as e:
+        return False, {
+            "file": path_str,
+            "valid": False,
+            "error_type": "JSON_DECODE_ERROR",
+            "error": str(e),
+            "line": getattr(e, 'lineno', None),
+            "column": getattr(e, 'colno', None)
+        }, None
+        
+    except (SchemaError,) + _SCHEMA_ERRORS as e:
+        message, path, failed_value = _schema_error_details(e)
+        return False, {
+            "file": path_str,
+            "valid": False,
+            "error_type": "SCHEMA_VALIDATION_ERROR",
+            "error": str(message),
+            "schema_path": path,
+            "failed_value": failed_value,
+            # Previews are only built for failures, never on the hot path
+            "data_preview": _safe_preview(data)
+        }, None
+        
+    except Exception as e:
+        return False, {
+            "file": path_str,
+            "valid": False,
+            "error_type": "UNEXPECTED_ERROR",
+            "error": str(e)
+        }, None
+
 class HumanAIFrameworkValidator:
     """
     Exclusive validator for HUMAN AI FRAMEWORK weekly compilation data
@@ -86,159 +453,82 @@ class HumanAIFrameworkValidator:
     
     def __init__(self, base_dir: str = None):
         self.base_dir = Path(base_dir) if base_dir else Path(__file__).parent
-        self.validation_results = []
+        self.validation_results = deque(maxlen=VALIDATION_LOG_MAXLEN)
+        self.log_level_counts = Counter()
+        self._pending_output = []
         self.error_count = 0
         self.valid_count = 0
+        # Per-file results are streamed to results_path; only failures stay in memory
+        self.total_files = 0
+        self.failed_results = []
+        self.results_path = None
         
     def log_validation(self, level: str, message: str, details: Dict = None):
         """Log validation events with security context"""
-        timestamp = datetime.now().isoformat()
-        log_entry = {
-            "timestamp": timestamp,
+        self._pending_output.append(f"[{level}] {message}\n")
+        if details:
+            self._pending_output.append(f"    Details: {details}\n")
+        
+        # Per-file INFO lines are only counted; their results are in results_path
+        self.log_level_counts[level] += 1
+        if level not in REPORTED_LOG_LEVELS:
+            return
+        
+        # Timestamps are kept as ns and only formatted when a report is generated
+        self.validation_results.append({
+            "timestamp": time.time_ns(),
             "level": level,
             "message": message,
             "security_context": "HUMAN-AI-FRAMEWORK-EXCLUSIVE",
             "details": details or {}
-        }
-        
-        print(f"[{level}] {message}")
-        if details:
-            print(f"    Details: {details}")
-            
-        self.validation_results.append(log_entry)
-        
-    def calculate_file_checksum(self, file_path: Path) -> str:
-        """Calculate SHA-256 checksum for file integrity"""
-        sha256_hash = hashlib.sha256()
-        try:
-            with open(file_path, "rb") as f:
-                for chunk in iter(lambda: f.read(4096), b""):
-                    sha256_hash.update(chunk)
-            return sha256_hash.hexdigest()
-        except Exception as e:
-            self.log_validation("ERROR", f"Failed to calculate checksum for {file_path}", {"error": str(e)})
-            return ""
+        })
     
-    def get_schema_for_file(self, file_path: Path) -> Dict:
-        """Determine appropriate schema based on file name/path"""
-        file_name = file_path.name.lower()
+    def flush_log(self) -> None:
+        """Write buffered log lines to stdout in a single call"""
+        if self._pending_output:
+            sys.stdout.write("".join(self._pending_output))
+            sys.stdout.flush()
+            self._pending_output.clear()
         
-        if "objectives" in file_name:
-            return SCHEMAS["objectives"]
-        elif "report" in file_name:
-            return SCHEMAS["report"]
-        elif "config" in file_name:
-            return SCHEMAS["config"]
-        else:
-            # Generic JSON schema
-            return {"type": "object"}
+    def validate_json_file(self, file_path: Path) -> Tuple[bool, Dict, Any]:
+        """Validate a single JSON file, returning the parsed data when valid and
+        still needed for the security check (None for objectives and reports)"""
+        is_valid, result, data = _validate_one(str(file_path))
+        self._record_result(file_path, is_valid, result)
+        return is_valid, result, data
     
-    def validate_json_file(self, file_path: Path) -> Tuple[bool, Dict]:
-        """Validate a single JSON file against appropriate schema"""
-        try:
-            # Read and parse JSON
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
-            # Get appropriate schema
-            schema = self.get_schema_for_file(file_path)
-            
-            # Validate against schema
-            jsonschema.validate(data, schema)
-            
-            # Calculate checksum for integrity
-            checksum = self.calculate_file_checksum(file_path)
-            
-            result = {
-                "file": str(file_path),
-                "valid": True,
-                "schema_type": self.get_schema_type(file_path),
-                "checksum": checksum,
-                "size_bytes": file_path.stat().st_size,
-                "data_preview": self.get_safe_preview(data)
-            }
-            
+    def _record_result(self, file_path: Path, is_valid: bool, result: Dict) -> None:
+        """Count and log the outcome of a single file validation"""
+        if is_valid:
             self.valid_count += 1
             self.log_validation("INFO", f"Valid JSON: {file_path.name}", {
                 "schema": result["schema_type"],
                 "size": result["size_bytes"]
             })
-            
-            return True, result
-            
-        except json.JSONDecodeError as e:
-            self.error_count += 1
-            result = {
-                "file": str(file_path),
-                "valid": False,
-                "error_type": "JSON_DECODE_ERROR",
-                "error": str(e),
-                "line": getattr(e, 'lineno', None),
-                "column": getattr(e, 'colno', None)
-            }
-            
+            return
+        
+        self.error_count += 1
+        error_type = result["error_type"]
+        
+        if error_type == "JSON_DECODE_ERROR":
             self.log_validation("ERROR", f"JSON decode error in {file_path.name}", {
-                "error": str(e),
+                "error": result["error"],
                 "line": result.get("line"),
                 "column": result.get("column")
             })
-            
-            return False, result
-            
-        except jsonschema.ValidationError as e:
-            self.error_count += 1
-            result = {
-                "file": str(file_path),
-                "valid": False,
-                "error_type": "SCHEMA_VALIDATION_ERROR",
-                "error": str(e.message),
-                "schema_path": list(e.absolute_path),
-                "failed_value": e.instance
-            }
-            
+        elif error_type == "SCHEMA_VALIDATION_ERROR":
             self.log_validation("ERROR", f"Schema validation error in {file_path.name}", {
-                "error": str(e.message),
+                "error": result["error"],
                 "path": result["schema_path"]
             })
-            
-            return False, result
-            
-        except Exception as e:
-            self.error_count += 1
-            result = {
-                "file": str(file_path),
-                "valid": False,
-                "error_type": "UNEXPECTED_ERROR",
-                "error": str(e)
-            }
-            
+        else:
             self.log_validation("ERROR", f"Unexpected error validating {file_path.name}", {
-                "error": str(e)
+                "error": result["error"]
             })
-            
-            return False, result
-    
-    def get_schema_type(self, file_path: Path) -> str:
-        """Determine schema type from file path"""
-        file_name = file_path.name.lower()
-        if "objectives" in file_name:
-            return "objectives"
-        elif "report" in file_name:
-            return "report"
-        elif "config" in file_name:
-            return "config"
-        else:
-            return "generic"
     
     def get_safe_preview(self, data: Any, max_length: int = 200) -> str:
         """Get safe preview of data for logging (no sensitive info exposure)"""
-        try:
-            preview = json.dumps(data, indent=2)
-            if len(preview) > max_length:
-                preview = preview[:max_length] + "..."
-            return preview
-        except:
-            return str(type(data))
+        return _safe_preview(data, max_length)
     
     def validate_security_constraints(self, data: Dict, file_path: Path) -> bool:
         """Validate that data meets HUMAN-AI-FRAMEWORK security requirements"""
@@ -246,18 +536,20 @@ class HumanAIFrameworkValidator:
         
         # Check for space name restrictions
         if "spaceName" in data:
-            if not data["spaceName"].startswith("001-HUMAN-AI-FRAMEWORK"):
+            if not data["spaceName"].startswith(_SPACE_NAME_PREFIX):
                 security_violations.append("Invalid spaceName - must be HUMAN-AI-FRAMEWORK variant")
         
-        # Check security section if present
+        # Check security section if present; compliant sections pass with a
+        # single subset test (the identity check rejects exclusiveAccess: 1)
         if "security" in data:
             security = data["security"]
-            if security.get("dataSharing") != "PROHIBITED":
-                security_violations.append("dataSharing must be PROHIBITED")
-            if security.get("accessLevel") != "HUMAN-AI-FRAMEWORK-ONLY":
-                security_violations.append("accessLevel must be HUMAN-AI-FRAMEWORK-ONLY")
-            if security.get("exclusiveAccess") is not True:
-                security_violations.append("exclusiveAccess must be true")
+            if not (security.items() >= _REQUIRED_SEC and security["exclusiveAccess"] is True):
+                if security.get("dataSharing") != "PROHIBITED":
+                    security_violations.append("dataSharing must be PROHIBITED")
+                if security.get("accessLevel") != "HUMAN-AI-FRAMEWORK-ONLY":
+                    security_violations.append("accessLevel must be HUMAN-AI-FRAMEWORK-ONLY")
+                if security.get("exclusiveAccess") is not True:
+                    security_violations.append("exclusiveAccess must be true")
         
         if security_violations:
             self.log_validation("ERROR", f"Security violations in {file_path.name}", {
@@ -267,14 +559,33 @@ class HumanAIFrameworkValidator:
         
         return True
     
+    def _walk_json(self, root: Path):
+        """Yield *.json files under root using directory entry types (no per-file stat)"""
+        stack = [root]
+        while stack:
+            directory = stack.pop()
+            # Like rglob, skip directories that cannot be read
+            try:
+                entries = os.scandir(directory)
+            except OSError as e:
+                self.log_validation("WARN", f"Could not read directory {directory}", {
+                    "error": str(e)
+                })
+                continue
+            
+            with entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file() and entry.name.endswith(".json"):
+                        yield Path(entry.path)
+    
     def discover_json_files(self, directory: Path) -> List[Path]:
         """Discover all JSON files in directory tree"""
         json_files = []
         
         try:
-            for file_path in directory.rglob("*.json"):
-                if file_path.is_file():
-                    json_files.append(file_path)
+            json_files = list(self._walk_json(directory))
             
             self.log_validation("INFO", f"Discovered {len(json_files)} JSON files", {
                 "directory": str(directory),
@@ -288,8 +599,24 @@ class HumanAIFrameworkValidator:
         
         return json_files
     
+    def _iter_outcomes(self, json_files: List[Path]):
+        """Yield _validate_one results in order, using worker processes for large folders"""
+        paths = [str(p) for p in json_files]
+        if len(paths) < PARALLEL_MIN_FILES:
+            yield from map(_validate_one, paths)
+            return
+        
+        with ProcessPoolExecutor() as executor:
+            yield from executor.map(_validate_one, paths, chunksize=16)
+    
     def validate_weekly_compilation(self, weekly_folder: str = None) -> Dict:
         """Validate all JSON files in a weekly compilation"""
+        try:
+            return self._validate_weekly_compilation(weekly_folder)
+        finally:
+            self.flush_log()
+    
+    def _validate_weekly_compilation(self, weekly_folder: str = None) -> Dict:
         if weekly_folder:
             target_dir = self.base_dir / "compiled-data" / weekly_folder
         else:
@@ -299,14 +626,10 @@ class HumanAIFrameworkValidator:
                 self.log_validation("ERROR", "No compiled-data directory found")
                 return self.generate_validation_report()
             
-            weekly_folders = [d for d in compiled_data_dir.iterdir() 
-                            if d.is_dir() and d.name.startswith("weekly-")]
-            
-            if not weekly_folders:
+            target_dir = self._find_latest_weekly(compiled_data_dir)
+            if target_dir is None:
                 self.log_validation("ERROR", "No weekly compilation folders found")
                 return self.generate_validation_report()
-            
-            target_dir = max(weekly_folders, key=lambda d: d.stat().st_mtime)
         
         if not target_dir.exists():
             self.log_validation("ERROR", f"Target directory does not exist: {target_dir}")
@@ -316,38 +639,80 @@ class HumanAIFrameworkValidator:
         
         # Discover and validate all JSON files
         json_files = self.discover_json_files(target_dir)
-        validation_results = []
+        results_file = self._open_results_file(target_dir)
         
-        for json_file in json_files:
-            is_valid, result = self.validate_json_file(json_file)
-            validation_results.append(result)
-            
-            # Additional security validation for valid files
-            if is_valid and json_file.suffix == '.json':
-                try:
-                    with open(json_file, 'r') as f:
-                        data = json.load(f)
-                    self.validate_security_constraints(data, json_file)
-                except Exception as e:
-                    self.log_validation("WARN", f"Could not perform security validation on {json_file.name}", {
-                        "error": str(e)
-                    })
+        try:
+            for json_file, (is_valid, result, data) in zip(json_files, self._iter_outcomes(json_files)):
+                self._record_result(json_file, is_valid, result)
+                self.total_files += 1
+                if not is_valid:
+                    self.failed_results.append(result)
+                if results_file:
+                    results_file.write(_dumps_line(result))
+                
+                # Objectives and report schemas enforce the security rules
+                # themselves; other types keep the Python-level check
+                if is_valid and result["schema_type"] not in _SECURITY_ENFORCED_BY_SCHEMA:
+                    try:
+                        self.validate_security_constraints(data, json_file)
+                    except Exception as e:
+                        self.log_validation("WARN", f"Could not perform security validation on {json_file.name}", {
+                            "error": str(e)
+                        })
+        finally:
+            if results_file:
+                results_file.close()
         
-        return self.generate_validation_report(validation_results)
+        return self.generate_validation_report()
     
-    def generate_validation_report(self, file_results: List[Dict] = None) -> Dict:
-        """Generate comprehensive validation report"""
+    def _find_latest_weekly(self, compiled_data_dir: Path):
+        """Most recently modified weekly- folder, stat'ing each entry once"""
+        latest = None
+        latest_mtime = None
+        with os.scandir(compiled_data_dir) as entries:
+            for entry in entries:
+                if not entry.name.startswith("weekly-") or not entry.is_dir():
+                    continue
+                mtime = entry.stat().st_mtime
+                if latest_mtime is None or mtime > latest_mtime:
+                    latest, latest_mtime = entry.path, mtime
+        
+        return Path(latest) if latest else None
+    
+    def _open_results_file(self, target_dir: Path):
+        """Open validation/results.jsonl for streaming per-file results"""
+        results_path = target_dir / "validation" / "results.jsonl"
+        try:
+            results_path.parent.mkdir(exist_ok=True)
+            results_file = open(results_path, 'wb')
+        except OSError as e:
+            self.log_validation("WARN", f"Could not open results file {results_path}", {
+                "error": str(e)
+            })
+            return None
+        
+        self.results_path = results_path
+        return results_file
+    
+    def generate_validation_report(self) -> Dict:
+        """Generate validation summary; per-file results live in results_path and
+        only warnings and errors are kept in validation_log"""
         report = {
             "timestamp": datetime.now().isoformat(),
             "security_context": "HUMAN-AI-FRAMEWORK-EXCLUSIVE",
             "validation_summary": {
-                "total_files": len(file_results) if file_results else 0,
+                "total_files": self.total_files,
                 "valid_files": self.valid_count,
                 "invalid_files": self.error_count,
                 "success_rate": (self.valid_count / max(1, self.valid_count + self.error_count)) * 100
             },
-            "file_results": file_results or [],
-            "validation_log": self.validation_results,
+            "results_path": str(self.results_path) if self.results_path else None,
+            "failed_results": self.failed_results,
+            "log_level_counts": dict(self.log_level_counts),
+            "validation_log": [
+                dict(entry, timestamp=_format_timestamp_ns(entry["timestamp"]))
+                for entry in self.validation_results
+            ],
             "security_compliance": {
                 "data_exclusive": True,
                 "no_external_sharing": True,
@@ -369,20 +734,25 @@ class HumanAIFrameworkValidator:
             report_path = validation_dir / "validation-report.json"
             backup_path = validation_dir / "validation-report-backup.json"
             
-            # Write primary and backup
-            with open(report_path, 'w') as f:
-                json.dump(report, f, indent=2)
+            # Serialize once and write the same bytes to primary and backup
+            encoded = _dumps_indented(report)
+            report_path.write_bytes(encoded)
+            backup_path.write_bytes(encoded)
             
-            with open(backup_path, 'w') as f:
-                json.dump(report, f, indent=2)
+            # Both files hold the same buffer, so hash it in memory once
+            primary_checksum = hashlib.sha256(encoded).hexdigest()
+            backup_checksum = primary_checksum
             
-            # Generate checksums
-            primary_checksum = self.calculate_file_checksum(report_path)
-            backup_checksum = self.calculate_file_checksum(backup_path)
+            # Per-file results are already on disk; back them up as a byte copy
+            results_backup_path = None
+            if self.results_path and self.results_path.exists():
+                results_backup_path = validation_dir / "results-backup.jsonl"
+                shutil.copyfile(self.results_path, results_backup_path)
             
             self.log_validation("INFO", "Validation report created", {
                 "report_path": str(report_path),
                 "backup_path": str(backup_path),
+                "results_backup_path": str(results_backup_path) if results_backup_path else None,
                 "primary_checksum": primary_checksum,
                 "backup_checksum": backup_checksum,
                 "integrity_match": primary_checksum == backup_checksum
@@ -392,6 +762,9 @@ class HumanAIFrameworkValidator:
             self.log_validation("ERROR", "Failed to create validation backup", {
                 "error": str(e)
             })
+        
+        finally:
+            self.flush_log()
 
 def main():
     """Main CLI interface"""
@@ -422,21 +795,17 @@ def main():
     # Print errors if any
     if summary['invalid_files'] > 0:
         print(f"\n❌ Validation Errors:")
-        for result in report["file_results"]:
-            if not result.get("valid", True):
-                print(f"   • {result['file']}: {result.get('error', 'Unknown error')}")
+        for result in report["failed_results"]:
+            print(f"   • {result['file']}: {result.get('error', 'Unknown error')}")
     
     # Create backup if validation successful
     if summary['success_rate'] >= 80:  # 80% success threshold
         print(f"\n✅ Validation completed successfully!")
-        # Extract weekly folder from successful validation
-        if report["file_results"]:
-            # Try to determine weekly folder from file paths
-            sample_path = Path(report["file_results"][0]["file"])
-            for parent in sample_path.parents:
-                if parent.name.startswith("weekly-"):
-                    validator.create_backup_validation(parent.name)
-                    break
+        # Results are written to <weekly folder>/validation/results.jsonl
+        if report["results_path"]:
+            weekly_dir = Path(report["results_path"]).parent.parent
+            if weekly_dir.name.startswith("weekly-"):
+                validator.create_backup_validation(weekly_dir.name)
     else:
         print(f"\n⚠️  Validation completed with warnings")
     
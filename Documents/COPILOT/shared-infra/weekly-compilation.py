@@ -7,22 +7,102 @@ Maintains security isolation and prevents cross-space content sharing
 """
 
 import os
+import re
 import sys
 import json
+import gzip
+import fnmatch
 import shutil
 import logging
 import sqlite3
 import hashlib
+import functools
+import mmap
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Iterator, Optional, Tuple
 import subprocess
 
+try:
+    import fcntl
+except ImportError:
+    fcntl = None  # Windows
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+try:
+    import blake3
+except ImportError:
+    blake3 = None
+
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+try:
+    import psutil
+    psutil.cpu_percent(interval=None)  # Prime the counter; the first reading is always 0.0
+except ImportError:
+    psutil = None
+
 # Configuration
 FRAMEWORK_SPACE = "HUMAN-AI-FRAMEWORK"
 COMPILATION_DIR = Path.cwd() / "human-ai-framework"
 WEEKS_TO_RETAIN = 12
 LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
+HASH_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+HASH_BUFFER_SIZE = 1024 * 1024  # Read size when hashlib.file_digest is unavailable
+MMAP_HASH_THRESHOLD = 1024 * 1024  # Files at least this large are hashed through mmap
+COPY_CHUNK_SIZE = 1024 * 1024 * 1024  # Upper bound per os.copy_file_range/os.sendfile call
+
+# Collection globs ('dir/name-pattern', relative to the searched base directory)
+LOG_PATTERNS = ["*.log", "copilot*.log", "*.txt", "access.log*", "error.log*"]
+CONVERSATION_PATTERNS = ['conversation-*.json', 'chat-history-*.json', 'session-*.json']
+FRAMEWORK_CONFIG_PATTERNS = [
+    'copilot/config.json',
+    'config/copilot-schema.json',
+    'human-ai-framework/*.json',
+    '.env.framework'
+]
+
+# Markers of FRAMEWORK-specific content, matched against lowercased file bytes
+FRAMEWORK_SPACE_BYTES = FRAMEWORK_SPACE.lower().encode()
+FRAMEWORK_INDICATORS_BYTES = (FRAMEWORK_SPACE_BYTES, b'[framework]', b'human-ai-framework')
+
+# References to other spaces that must never appear in FRAMEWORK data
+PROHIBITED_SPACES = [
+    'general-space', 'shared-space', 'public-space',
+    'common-infrastructure', 'cross-space'
+]
+PROHIBITED_SPACES_RE = re.compile('|'.join(map(re.escape, PROHIBITED_SPACES)))
+
+# Hash for file change detection; not a security boundary, so take the fastest installed
+if blake3 is not None:
+    HASH_ALGORITHM, new_file_hash = 'blake3', blake3.blake3
+elif xxhash is not None:
+    HASH_ALGORITHM, new_file_hash = 'xxh3_128', xxhash.xxh3_128
+else:
+    HASH_ALGORITHM, new_file_hash = 'sha256', hashlib.sha256
+
+# Upsert for the compilations table
+COMPILATION_INSERT_SQL = """
+    INSERT OR REPLACE INTO compilations
+    (week_id, compilation_date, files_processed, total_size_bytes, checksum, metadata)
+    VALUES (?, ?, ?, ?, ?, ?)
+"""
+
+# Linux reflink ioctl (exposed as fcntl.FICLONE from Python 3.12)
+FICLONE = getattr(fcntl, 'FICLONE', 0x40049409) if fcntl and sys.platform.startswith('linux') else None
 
 # Logging setup
 logging.basicConfig(
@@ -35,9 +115,178 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+def _dumps(data: Any) -> bytes:
+    """Serialize data as compact JSON bytes, using orjson when installed"""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(',', ':')).encode('utf-8')
+
+def _write_compressed(path: Path, payload: bytes) -> Path:
+    """Write payload as path.zst (zstandard) or path.gz; return the file written"""
+    if zstandard is not None:
+        path = path.with_name(path.name + '.zst')
+        path.write_bytes(zstandard.ZstdCompressor(level=3).compress(payload))
+    else:
+        path = path.with_name(path.name + '.gz')
+        path.write_bytes(gzip.compress(payload, compresslevel=1))
+    return path
+
+@functools.lru_cache(maxsize=4096)
+def _fmt_ts(timestamp: float) -> str:
+    """ISO format of a POSIX timestamp; memoized because file mtimes cluster"""
+    return datetime.fromtimestamp(timestamp).isoformat()
+
+def _checkpoint_key(path) -> str:
+    """Normalized absolute path used to key checkpoint entries"""
+    return os.path.abspath(path)
+
+def _prefetch(paths) -> None:
+    """Queue kernel readahead for a batch of files before they are read one by one"""
+    if not hasattr(os, 'posix_fadvise'):
+        return
+    for path in paths:
+        try:
+            fd = os.open(path, os.O_RDONLY)
+        except OSError:
+            continue
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
+def _update_hash_from_file(hash_obj, f) -> None:
+    """Feed an open binary file into hash_obj
+    
+    Large files are hashed from one mmap in a single update() call. Otherwise
+    hashlib.file_digest is used where available. Its loop is still Python-level,
+    but it reads into one reused 256 KiB buffer instead of allocating per chunk.
+    """
+    if os.fstat(f.fileno()).st_size >= MMAP_HASH_THRESHOLD:
+        try:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                hash_obj.update(mm)
+            return
+        except (OSError, ValueError):
+            pass  # Not mappable (e.g. truncated meanwhile); stream it instead
+    
+    if hasattr(hashlib, 'file_digest'):
+        hashlib.file_digest(f, lambda: hash_obj)
+    else:
+        for chunk in iter(lambda: f.read(HASH_BUFFER_SIZE), b""):
+            hash_obj.update(chunk)
+
+def _copy_file_data(fsrc, fdst) -> None:
+    """Copy file contents via reflink, then in-kernel copy_file_range or sendfile, then buffered copy"""
+    src_fd, dst_fd = fsrc.fileno(), fdst.fileno()
+    
+    if FICLONE is not None:
+        try:
+            fcntl.ioctl(dst_fd, FICLONE, src_fd)
+            return
+        except OSError:
+            pass  # Filesystem without reflink support, or a cross-device copy
+    
+    if hasattr(os, 'copy_file_range'):
+        offset = 0
+        try:
+            while True:
+                copied = os.copy_file_range(src_fd, dst_fd, COPY_CHUNK_SIZE, offset, offset)
+                if not copied:
+                    return
+                offset += copied
+        except OSError:
+            if offset:
+                raise  # Partially copied; don't silently append a second copy
+    
+    if hasattr(os, 'sendfile'):
+        offset = 0
+        try:
+            while True:
+                sent = os.sendfile(dst_fd, src_fd, offset, COPY_CHUNK_SIZE)
+                if not sent:
+                    return
+                offset += sent
+        except OSError:
+            if offset:
+                raise
+    
+    shutil.copyfileobj(fsrc, fdst)
+
+def _fast_copy(src: Path, dst: Path) -> None:
+    """Copy a file with its metadata, like shutil.copy2"""
+    with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+        _copy_file_data(fsrc, fdst)
+    shutil.copystat(src, dst)
+
+def _iter_strings(data: Any) -> Iterator[str]:
+    """Yield every string key and value nested in data"""
+    pending = [data]
+    
+    while pending:
+        value = pending.pop()
+        if isinstance(value, str):
+            yield value
+        elif isinstance(value, dict):
+            for key, item in value.items():
+                if isinstance(key, str):
+                    yield key
+                pending.append(item)
+        elif isinstance(value, (list, tuple)):
+            pending.extend(value)
+
+def _list_dir(path) -> List[os.DirEntry]:
+    """List directory entries, or nothing if the directory cannot be read"""
+    try:
+        with os.scandir(path) as entries:
+            return list(entries)
+    except OSError:
+        return []
+
+def _compile_globs(patterns: List[str]) -> Dict[str, re.Pattern]:
+    """Group 'dir/name-pattern' globs by directory into one regex per directory"""
+    grouped = {}
+    for pattern in patterns:
+        dir_part, _, name_pattern = pattern.rpartition('/')
+        grouped.setdefault(dir_part, []).append(fnmatch.translate(name_pattern))
+    return {dir_part: re.compile('|'.join(regexes)) for dir_part, regexes in grouped.items()}
+
+def _glob_entries(base: Path, globs: Dict[str, re.Pattern]) -> List[os.DirEntry]:
+    """Entries under base matching compiled globs, scanning each directory once"""
+    return [
+        entry
+        for dir_part, regex in globs.items()
+        for entry in _list_dir(base / dir_part)
+        if regex.match(entry.name)
+    ]
+
+LOG_GLOBS = _compile_globs(LOG_PATTERNS)
+CONVERSATION_GLOBS = _compile_globs(CONVERSATION_PATTERNS)
+FRAMEWORK_CONFIG_GLOBS = _compile_globs(FRAMEWORK_CONFIG_PATTERNS)
+
+def _iter_files(root) -> Iterator[os.DirEntry]:
+    """Yield files below root in the same order as Path.rglob('*')"""
+    pending = [root]
+    
+    while pending:
+        subdirs = []
+        for entry in _list_dir(pending.pop()):
+            if entry.is_dir(follow_symlinks=False):
+                subdirs.append(entry.path)
+            elif entry.is_file():
+                yield entry
+        pending.extend(reversed(subdirs))
+
 class SecurityManager:
     """Manages security and access control for HUMAN AI FRAMEWORK"""
     
+    # Field names of the two values each audit tuple carries, per action
+    AUDIT_FIELDS = {
+        'access_validation': ('space', 'result'),
+        'compilation_operation': ('operation', 'files_processed')
+    }
+    
     def __init__(self):
         self.framework_hash = self._calculate_framework_hash()
         self.audit_log = []
@@ -45,18 +294,14 @@ class SecurityManager:
     def _calculate_framework_hash(self) -> str:
         """Calculate unique hash for HUMAN AI FRAMEWORK space"""
         identifier = f"{FRAMEWORK_SPACE}-{datetime.now().strftime('%Y-%m')}"
-        return hashlib.sha256(identifier.encode()).hexdigest()[:16]
+        return hashlib.sha256(identifier.encode()).digest()[:8].hex()
     
     def validate_framework_access(self, space_name: str) -> bool:
         """Validate that current space is HUMAN AI FRAMEWORK"""
         is_valid = space_name == FRAMEWORK_SPACE
-        self.audit_log.append({
-            'timestamp': datetime.now().isoformat(),
-            'action': 'access_validation',
-            'space': space_name,
-            'result': 'granted' if is_valid else 'denied',
-            'hash': self.framework_hash
-        })
+        self.audit_log.append((
+            datetime.now(), 'access_validation', space_name, 'granted' if is_valid else 'denied'
+        ))
         
         if not is_valid:
             logger.warning(f"Access denied: Invalid space '{space_name}' for FRAMEWORK operations")
@@ -65,13 +310,7 @@ class SecurityManager:
     
     def log_compilation_access(self, operation: str, files_count: int) -> None:
         """Log compilation operations for audit trail"""
-        self.audit_log.append({
-            'timestamp': datetime.now().isoformat(),
-            'action': 'compilation_operation',
-            'operation': operation,
-            'files_processed': files_count,
-            'hash': self.framework_hash
-        })
+        self.audit_log.append((datetime.now(), 'compilation_operation', operation, files_count))
         
         logger.info(f"Audit: {operation} - {files_count} files processed")
     
@@ -83,12 +322,19 @@ class SecurityManager:
             'framework_hash': self.framework_hash,
             'compilation_date': datetime.now().isoformat(),
             'space_verified': FRAMEWORK_SPACE,
-            'operations': self.audit_log,
+            'operations': [
+                {
+                    'timestamp': timestamp.isoformat(),
+                    'action': action,
+                    **dict(zip(self.AUDIT_FIELDS[action], values)),
+                    'hash': self.framework_hash
+                }
+                for timestamp, action, *values in self.audit_log
+            ],
             'retention_policy': f"{WEEKS_TO_RETAIN} weeks"
         }
         
-        with open(audit_file, 'w') as f:
-            json.dump(audit_data, f, indent=2)
+        audit_file = _write_compressed(audit_file, _dumps(audit_data))
         
         logger.info(f"Audit log saved: {audit_file}")
 
@@ -96,32 +342,43 @@ class WeeklyCompiler:
     """Handles weekly compilation of HUMAN AI FRAMEWORK exclusive content"""
     
     def __init__(self, space_name: str):
+        # Validate exclusive access before doing any other work
+        if space_name != FRAMEWORK_SPACE:
+            logger.warning(f"Access denied: Invalid space '{space_name}' for FRAMEWORK operations")
+            raise PermissionError(f"Weekly compilation restricted to {FRAMEWORK_SPACE} only")
+        
         self.space_name = space_name
-        self.security_manager = SecurityManager()
         self.compilation_date = datetime.now()
+        self._compilation_date_iso = self.compilation_date.isoformat()
         self.week_id = self.compilation_date.strftime('%Y-W%U')
         self.db_path = COMPILATION_DIR / "compilations.db"
         self.checkpoint_file = Path.cwd() / "last-run-checkpoint.json"
+        self._conn = None
+        self.files_collected = 0
         
         # Load previous checkpoint for duplicate prevention
         self.checkpoint = self._load_checkpoint()
         self.new_checkpoint = {
             "files": {},
-            "timestamp": self.compilation_date.isoformat(),
+            "validated": {},
+            "timestamp": self._compilation_date_iso,
             "week_id": self.week_id
         }
-        
-        # Validate exclusive access
-        if not self.security_manager.validate_framework_access(space_name):
-            raise PermissionError(f"Weekly compilation restricted to {FRAMEWORK_SPACE} only")
+    
+    @functools.cached_property
+    def security_manager(self) -> SecurityManager:
+        """Security manager, built on first use; records the granted access in its audit log"""
+        security_manager = SecurityManager()
+        security_manager.validate_framework_access(self.space_name)
+        return security_manager
     
     def _load_checkpoint(self) -> Dict[str, Any]:
         """Load previous checkpoint to prevent duplicate processing"""
         try:
-            with open(self.checkpoint_file, 'r', encoding='utf-8') as f:
-                checkpoint = json.load(f)
-                logger.info(f"Loaded checkpoint with {len(checkpoint.get('files', {}))} tracked files")
-                return checkpoint
+            raw = self.checkpoint_file.read_bytes()
+            checkpoint = orjson.loads(raw) if orjson is not None else json.loads(raw)
+            logger.info(f"Loaded checkpoint with {len(checkpoint.get('files', {}))} tracked files")
+            return checkpoint
         except FileNotFoundError:
             logger.info("No previous checkpoint found - starting fresh")
             return {"files": {}, "timestamp": None}
@@ -135,8 +392,11 @@ class WeeklyCompiler:
             # Write to temporary file first
             temp_file = self.checkpoint_file.with_suffix('.tmp')
             
-            with open(temp_file, 'w', encoding='utf-8') as f:
-                json.dump(self.new_checkpoint, f, indent=2, ensure_ascii=False)
+            if orjson is not None:
+                temp_file.write_bytes(orjson.dumps(self.new_checkpoint, option=orjson.OPT_INDENT_2))
+            else:
+                with open(temp_file, 'w', encoding='utf-8') as f:
+                    json.dump(self.new_checkpoint, f, indent=2, ensure_ascii=False)
             
             # Atomic move to final location
             temp_file.replace(self.checkpoint_file)
@@ -146,34 +406,124 @@ class WeeklyCompiler:
         except Exception as e:
             logger.error(f"Failed to save checkpoint: {e}")
     
-    def _calculate_file_checksum(self, file_path: Path) -> str:
-        """Calculate SHA-256 checksum for duplicate detection"""
-        hash_sha256 = hashlib.sha256()
-        
+    def _read_sample(self, file_path: Path, sample_size: int) -> Optional[bytes]:
+        """First sample_size bytes of a file, or None when it cannot be read"""
         try:
             with open(file_path, 'rb') as f:
-                for chunk in iter(lambda: f.read(8192), b""):
-                    hash_sha256.update(chunk)
-            return hash_sha256.hexdigest()
+                return f.read(sample_size)
         except Exception as e:
-            logger.warning(f"Could not calculate checksum for {file_path}: {e}")
-            return "checksum_failed"
+            logger.warning(f"Could not read file {file_path}: {e}")
+            return None
     
-    def _should_process_file(self, file_path: Path) -> bool:
-        """Check if file should be processed based on checksum comparison"""
-        file_str = str(file_path.absolute())
-        current_checksum = self._calculate_file_checksum(file_path)
+    def _map_changed(self, func, file_paths: List[Path], stat_infos: List[os.stat_result],
+                     prefetch: bool = False) -> List[Any]:
+        """Apply func concurrently to files changed since the checkpoint; results come back in input order
+        
+        Files whose mtime and size match the checkpoint are not read and get None.
+        With prefetch, the kernel is asked to read the changed files ahead first.
+        """
+        results = [None] * len(file_paths)
+        changed = [
+            i for i, (path, stat_info) in enumerate(zip(file_paths, stat_infos))
+            if not self._unchanged_since_checkpoint(_checkpoint_key(path), stat_info)
+        ]
+        if prefetch:
+            _prefetch(file_paths[i] for i in changed)
         
-        # Check against previous checkpoint
-        previous_checksum = self.checkpoint.get("files", {}).get(file_str)
+        if len(changed) < 2:
+            values = [func(file_paths[i]) for i in changed]
+        else:
+            with ThreadPoolExecutor(max_workers=min(HASH_WORKERS, len(changed))) as executor:
+                values = list(executor.map(lambda i: func(file_paths[i]), changed))
+        
+        for i, value in zip(changed, values):
+            results[i] = value
+        return results
+    
+    def _read_samples(self, file_paths: List[Path], stat_infos: List[os.stat_result],
+                      sample_size: int) -> List[Optional[bytes]]:
+        """Read the leading sample of each changed file (None if unchanged or unreadable)"""
+        return self._map_changed(lambda path: self._read_sample(path, sample_size), file_paths, stat_infos)
+    
+    def _hash_files(self, file_paths: List[Path], stat_infos: List[os.stat_result],
+                    prefetch: bool = False) -> List[Optional[str]]:
+        """Hash each changed file (None if unchanged)"""
+        return self._map_changed(self._calculate_file_hash, file_paths, stat_infos, prefetch)
+    
+    def _hash_accepted_files(self, file_paths: List[Path], stat_infos: List[os.stat_result],
+                             sample_size: int, validator,
+                             prefetch: bool = False) -> List[Tuple[Path, os.stat_result, Optional[str]]]:
+        """Check each changed file's sample with validator, then hash only the files that pass
+        
+        Returns (path, stat, hash) for accepted files in input order; hash is None if unchanged.
+        With prefetch, only the accepted files are read ahead, just before hashing.
+        """
+        samples = self._read_samples(file_paths, stat_infos, sample_size)
+        accepted = [
+            (file_path, stat_info)
+            for file_path, stat_info, sample in zip(file_paths, stat_infos, samples)
+            if self._validate_cached(file_path, stat_info, sample, validator)
+        ]
+        file_hashes = self._hash_files([path for path, _ in accepted], [stat for _, stat in accepted], prefetch)
+        return [(path, stat, file_hash) for (path, stat), file_hash in zip(accepted, file_hashes)]
+    
+    def _unchanged_since_checkpoint(self, file_str: str, stat_info: os.stat_result) -> bool:
+        """Whether mtime and size match the checkpoint entry, so the file need not be hashed"""
+        previous = self.checkpoint.get("files", {}).get(file_str)
+        
+        # Bare checksum strings from older checkpoints carry no stat data
+        return (isinstance(previous, dict)
+                and previous.get("m") == stat_info.st_mtime_ns
+                and previous.get("s") == stat_info.st_size)
+    
+    def _cached_validation(self, file_str: str, stat_info: os.stat_result) -> Optional[bool]:
+        """Content validation result from the previous run if the file is unchanged"""
+        previous = self.checkpoint.get("validated", {}).get(file_str)
+        
+        if previous and previous[:2] == [stat_info.st_mtime_ns, stat_info.st_size]:
+            self.new_checkpoint["validated"][file_str] = previous
+            return previous[2]
+        return None
+    
+    def _validate_cached(self, file_path: Path, stat_info: os.stat_result,
+                         sample: Optional[bytes], validator) -> bool:
+        """Apply a content validator, reusing the checkpointed result for unchanged files"""
+        file_str = _checkpoint_key(file_path)
+        cached = self._cached_validation(file_str, stat_info)
+        if cached is not None:
+            return cached
+        
+        result = validator(sample)
+        if sample is not None:  # Read failures may be transient; don't remember them
+            self.new_checkpoint["validated"][file_str] = [stat_info.st_mtime_ns, stat_info.st_size, result]
+        return result
+    
+    def _should_process_file(self, file_path: Path, stat_info: os.stat_result,
+                             current_checksum: Optional[str]) -> bool:
+        """Check if file should be processed based on checksum comparison
+        
+        current_checksum is None when _hash_files found mtime and size unchanged.
+        """
+        file_str = _checkpoint_key(file_path)
+        
+        # Check against previous checkpoint; older checkpoints map paths to bare checksums
+        previous = self.checkpoint.get("files", {}).get(file_str)
+        previous_checksum = previous.get("h") if isinstance(previous, dict) else previous
+        
+        unchanged = current_checksum is None or previous_checksum == current_checksum
+        
+        # Update new checkpoint; unchanged files carry their entry forward (in the
+        # current format) so the next run can skip them without hashing again
+        self.new_checkpoint["files"][file_str] = {
+            "h": previous_checksum if unchanged else current_checksum,
+            "m": stat_info.st_mtime_ns,
+            "s": stat_info.st_size
+        }
         
-        if previous_checksum == current_checksum:
+        if unchanged:
             logger.debug(f"Skipping unchanged file: {file_path.name}")
             return False
         
-        # Update new checkpoint
-        self.new_checkpoint["files"][file_str] = current_checksum
-        
         if previous_checksum:
             logger.info(f"File changed, will process: {file_path.name}")
         else:
@@ -181,11 +531,28 @@ class WeeklyCompiler:
         
         return True
 
+    def _get_connection(self) -> sqlite3.Connection:
+        """Return the shared database connection, opening it on first use"""
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.db_path)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute("PRAGMA temp_store=MEMORY")
+            self._conn.execute("PRAGMA cache_size=-20000")  # ~20 MB page cache
+        return self._conn
+    
+    def close(self) -> None:
+        """Close the shared database connection"""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+    
     def init_database(self) -> None:
         """Initialize compilation tracking database"""
         COMPILATION_DIR.mkdir(exist_ok=True)
         
-        with sqlite3.connect(self.db_path) as conn:
+        conn = self._get_connection()
+        with conn:
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS compilations (
                     week_id TEXT PRIMARY KEY,
@@ -208,6 +575,10 @@ class WeeklyCompiler:
                     FOREIGN KEY (week_id) REFERENCES compilations (week_id)
                 )
             """)
+            
+            # Retention cleanup filters on these columns
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_comp_date ON compilations(compilation_date)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_files_week ON files_tracked(week_id)")
         
         logger.info("Compilation database initialized")
     
@@ -223,13 +594,17 @@ class WeeklyCompiler:
             'objectives_sync': self._synchronize_objectives()
         }
         
-        # Security validation - ensure no cross-space contamination
+        # Security validation - ensure no cross-space contamination,
+        # tallying files of the sources that pass
+        total_files = 0
         for source_name, source_data in data_sources.items():
             if source_data and not self._validate_data_exclusivity(source_data):
                 logger.warning(f"Data source {source_name} failed exclusivity validation")
                 data_sources[source_name] = {'error': 'exclusivity_validation_failed'}
+            elif isinstance(source_data, dict):
+                total_files += len(source_data.get('files', ()))
         
-        total_files = sum(len(data.get('files', [])) for data in data_sources.values() if isinstance(data, dict))
+        self.files_collected = total_files
         self.security_manager.log_compilation_access('data_collection', total_files)
         
         return data_sources
@@ -252,44 +627,52 @@ class WeeklyCompiler:
         
         # Get logs from the past week
         week_ago = self.compilation_date - timedelta(days=7)
+        week_ago_ts = week_ago.timestamp()
         log_files = []
         total_size = 0
         skipped_count = 0
         
         # Search multiple log patterns for comprehensive collection
-        log_patterns = ["*.log", "copilot*.log", "*.txt", "access.log*", "error.log*"]
+        candidates = [
+            (entry, stat_info)
+            for entry in _glob_entries(logs_dir, LOG_GLOBS)
+            if entry.is_file()
+            and (stat_info := entry.stat()).st_mtime >= week_ago_ts
+            # Unchanged logs already known not to be FRAMEWORK-specific are not read again
+            and self._cached_validation(_checkpoint_key(entry.path), stat_info) is not False
+        ]
         
-        for pattern in log_patterns:
-            for log_file in logs_dir.glob(pattern):
-                if log_file.is_file():
-                    stat_info = log_file.stat()
-                    modified_time = datetime.fromtimestamp(stat_info.st_mtime)
-                    
-                    if modified_time >= week_ago:
-                        # Validate log content is FRAMEWORK-specific
-                        if self._validate_log_framework_content(log_file):
-                            # Check for duplicates using checksum
-                            if self._should_process_file(log_file):
-                                log_files.append({
-                                    'path': str(log_file),
-                                    'size': stat_info.st_size,
-                                    'modified': modified_time.isoformat(),
-                                    'hash': self._calculate_file_hash(log_file),
-                                    'status': 'new_or_changed',
-                                    'source': 'shared' if logs_dir == shared_logs_dir else 'local'
-                                })
-                                total_size += stat_info.st_size
-                            else:
-                                skipped_count += 1
+        # Only logs whose content is FRAMEWORK-specific are hashed (sample first 4KB)
+        accepted = self._hash_accepted_files(
+            [Path(entry.path) for entry, _ in candidates],
+            [stat_info for _, stat_info in candidates],
+            4096, self._validate_log_framework_content,
+            prefetch=True  # Logs can be large; read accepted ones ahead of hashing
+        )
+        
+        for log_file, stat_info, file_hash in accepted:
+            # Check for duplicates using checksum
+            if self._should_process_file(log_file, stat_info, file_hash):
+                log_files.append({
+                    'path': str(log_file),
+                    'size': stat_info.st_size,
+                    'modified': _fmt_ts(stat_info.st_mtime),
+                    'hash': file_hash,
+                    'status': 'new_or_changed',
+                    'source': 'shared' if logs_dir == shared_logs_dir else 'local'
+                })
+                total_size += stat_info.st_size
+            else:
+                skipped_count += 1
         
         return {
             'files': log_files,
             'total_size': total_size,
             'files_skipped': skipped_count,
             'log_source': str(logs_dir),
-            'patterns_searched': log_patterns,
-            'collection_date': self.compilation_date.isoformat(),
-            'week_range': f"{week_ago.isoformat()} to {self.compilation_date.isoformat()}"
+            'patterns_searched': LOG_PATTERNS,
+            'collection_date': self._compilation_date_iso,
+            'week_range': f"{week_ago.isoformat()} to {self._compilation_date_iso}"
         }
     
     def _collect_conversation_data(self) -> Dict[str, Any]:
@@ -298,29 +681,31 @@ class WeeklyCompiler:
         skipped_count = 0
         
         # Look for conversation exports, chat histories, etc.
-        patterns = ['conversation-*.json', 'chat-history-*.json', 'session-*.json']
-        
-        for pattern in patterns:
-            for file_path in Path.cwd().glob(pattern):
-                if self._validate_file_framework_content(file_path):
-                    # Check for duplicates using checksum
-                    if self._should_process_file(file_path):
-                        stat_info = file_path.stat()
-                        conversation_files.append({
-                            'path': str(file_path),
-                            'size': stat_info.st_size,
-                            'modified': datetime.fromtimestamp(stat_info.st_mtime).isoformat(),
-                            'hash': self._calculate_file_hash(file_path),
-                            'status': 'new_or_changed'
-                        })
-                    else:
-                        skipped_count += 1
+        entries = _glob_entries(Path.cwd(), CONVERSATION_GLOBS)
+        accepted = self._hash_accepted_files(
+            [Path(entry.path) for entry in entries],
+            [entry.stat() for entry in entries],
+            2048, self._validate_file_framework_content  # Sample first 2KB
+        )
+        
+        for file_path, stat_info, file_hash in accepted:
+            # Check for duplicates using checksum
+            if self._should_process_file(file_path, stat_info, file_hash):
+                conversation_files.append({
+                    'path': str(file_path),
+                    'size': stat_info.st_size,
+                    'modified': _fmt_ts(stat_info.st_mtime),
+                    'hash': file_hash,
+                    'status': 'new_or_changed'
+                })
+            else:
+                skipped_count += 1
         
         return {
             'files': conversation_files,
             'files_skipped': skipped_count,
-            'patterns_searched': patterns,
-            'collection_date': self.compilation_date.isoformat()
+            'patterns_searched': CONVERSATION_PATTERNS,
+            'collection_date': self._compilation_date_iso
         }
     
     def _collect_framework_configs(self) -> Dict[str, Any]:
@@ -329,34 +714,28 @@ class WeeklyCompiler:
         skipped_count = 0
         
         # FRAMEWORK-specific configuration files
-        framework_configs = [
-            'copilot/config.json',
-            'config/copilot-schema.json',
-            'human-ai-framework/*.json',
-            '.env.framework'
-        ]
-        
-        for pattern in framework_configs:
-            for file_path in Path.cwd().glob(pattern):
-                if file_path.exists():
-                    # Check for duplicates using checksum
-                    if self._should_process_file(file_path):
-                        stat_info = file_path.stat()
-                        config_files.append({
-                            'path': str(file_path),
-                            'size': stat_info.st_size,
-                            'modified': datetime.fromtimestamp(stat_info.st_mtime).isoformat(),
-                            'hash': self._calculate_file_hash(file_path),
-                            'type': 'framework_config',
-                            'status': 'new_or_changed'
-                        })
-                    else:
-                        skipped_count += 1
+        entries = _glob_entries(Path.cwd(), FRAMEWORK_CONFIG_GLOBS)
+        file_paths = [Path(entry.path) for entry in entries]
+        stat_infos = [entry.stat() for entry in entries]
+        
+        for file_path, stat_info, file_hash in zip(file_paths, stat_infos, self._hash_files(file_paths, stat_infos)):
+            # Check for duplicates using checksum
+            if self._should_process_file(file_path, stat_info, file_hash):
+                config_files.append({
+                    'path': str(file_path),
+                    'size': stat_info.st_size,
+                    'modified': _fmt_ts(stat_info.st_mtime),
+                    'hash': file_hash,
+                    'type': 'framework_config',
+                    'status': 'new_or_changed'
+                })
+            else:
+                skipped_count += 1
         
         return {
             'files': config_files,
             'files_skipped': skipped_count,
-            'collection_date': self.compilation_date.isoformat()
+            'collection_date': self._compilation_date_iso
         }
     
     def _collect_weekly_metrics(self) -> Dict[str, Any]:
@@ -370,18 +749,17 @@ class WeeklyCompiler:
                 'platform': sys.platform,
                 'cwd': str(Path.cwd())
             },
-            'collection_timestamp': self.compilation_date.isoformat()
+            'collection_timestamp': self._compilation_date_iso
         }
         
-        # Try to collect system metrics if available
-        try:
-            import psutil
+        # Collect system metrics if available
+        if psutil is not None:
             metrics['system_metrics'] = {
-                'cpu_percent': psutil.cpu_percent(),
+                'cpu_percent': psutil.cpu_percent(interval=None),
                 'memory_percent': psutil.virtual_memory().percent,
                 'disk_usage': psutil.disk_usage('.').percent
             }
-        except ImportError:
+        else:
             metrics['system_metrics'] = {'note': 'psutil_not_available'}
         
         return metrics
@@ -393,29 +771,39 @@ class WeeklyCompiler:
         exclusive_files = []
         skipped_count = 0
         
-        for dir_name in exclusive_dirs:
-            dir_path = Path.cwd() / dir_name
-            if dir_path.exists():
-                for file_path in dir_path.rglob('*'):
-                    if file_path.is_file():
-                        # Check for duplicates using checksum
-                        if self._should_process_file(file_path):
-                            stat_info = file_path.stat()
-                            exclusive_files.append({
-                                'path': str(file_path.relative_to(Path.cwd())),
-                                'size': stat_info.st_size,
-                                'modified': datetime.fromtimestamp(stat_info.st_mtime).isoformat(),
-                                'hash': self._calculate_file_hash(file_path),
-                                'status': 'new_or_changed'
-                            })
-                        else:
-                            skipped_count += 1
+        # The tracking database's WAL sidecars are transient, not content
+        db_sidecars = {f"{self.db_path}-wal", f"{self.db_path}-shm"}
+        
+        cwd = Path.cwd()
+        cwd_prefix = os.path.join(str(cwd), '')
+        entries = [
+            entry
+            for dir_name in exclusive_dirs
+            for entry in _iter_files(cwd / dir_name)
+            if entry.path not in db_sidecars
+        ]
+        file_paths = [Path(entry.path) for entry in entries]
+        stat_infos = [entry.stat() for entry in entries]
+        file_hashes = self._hash_files(file_paths, stat_infos)
+        
+        for entry, file_path, stat_info, file_hash in zip(entries, file_paths, stat_infos, file_hashes):
+            # Check for duplicates using checksum
+            if self._should_process_file(file_path, stat_info, file_hash):
+                exclusive_files.append({
+                    'path': entry.path.removeprefix(cwd_prefix),
+                    'size': stat_info.st_size,
+                    'modified': _fmt_ts(stat_info.st_mtime),
+                    'hash': file_hash,
+                    'status': 'new_or_changed'
+                })
+            else:
+                skipped_count += 1
         
         return {
             'files': exclusive_files,
             'files_skipped': skipped_count,
             'directories_scanned': exclusive_dirs,
-            'collection_date': self.compilation_date.isoformat()
+            'collection_date': self._compilation_date_iso
         }
     
     def _synchronize_objectives(self) -> Dict[str, Any]:
@@ -435,120 +823,118 @@ class WeeklyCompiler:
                 'files': synchronized_files,
                 'note': 'Perplexity spaces directory not found',
                 'searched_paths': [str(shared_spaces_base), str(local_spaces_base)],
-                'collection_date': self.compilation_date.isoformat()
+                'collection_date': self._compilation_date_iso
             }
         
-        # Scan all spaces for objectives.json files
-        for space_dir in spaces_base.iterdir():
-            if space_dir.is_dir():
-                space_name = space_dir.name
-                objectives_file = space_dir / "objectives.json"
-                
-                if objectives_file.exists():
-                    try:
-                        with open(objectives_file, 'r', encoding='utf-8') as f:
-                            objectives_content = json.load(f)
-                        
-                        # Inject spaceName if not present
-                        if 'spaceName' not in objectives_content:
-                            objectives_content['spaceName'] = space_name
-                            
-                            # Write back with spaceName injection
-                            with open(objectives_file, 'w', encoding='utf-8') as f:
-                                json.dump(objectives_content, f, indent=2, ensure_ascii=False)
-                            
-                            logger.info(f"Injected spaceName into {space_name}/objectives.json")
-                        
-                        # Store objectives data
-                        objectives_data[space_name] = objectives_content
-                        
-                        # Track synchronized file
-                        stat_info = objectives_file.stat()
-                        synchronized_files.append({
-                            'space': space_name,
-                            'path': str(objectives_file),
-                            'size': stat_info.st_size,
-                            'modified': datetime.fromtimestamp(stat_info.st_mtime).isoformat(),
-                            'hash': self._calculate_file_hash(objectives_file),
-                            'spaceName_injected': True,
-                            'status': 'processed'
-                        })
-                        
-                    except Exception as e:
-                        logger.warning(f"Could not process objectives.json from {space_name}: {e}")
-                        synchronized_files.append({
-                            'space': space_name,
-                            'path': str(objectives_file),
-                            'error': str(e),
-                            'status': 'failed'
-                        })
+        # Scan all spaces for objectives.json files, reading them concurrently
+        space_names = [entry.name for entry in _list_dir(spaces_base) if entry.is_dir()]
+        with ThreadPoolExecutor(max_workers=max(1, min(HASH_WORKERS, len(space_names)))) as executor:
+            results = list(executor.map(
+                lambda name: self._sync_space_objectives(name, spaces_base / name / "objectives.json"),
+                space_names
+            ))
+        
+        for space_name, result in zip(space_names, results):
+            if result is None:
+                continue
+            objectives_content, file_info = result
+            if objectives_content is not None:
+                # Store objectives data
+                objectives_data[space_name] = objectives_content
+            # Track synchronized file
+            synchronized_files.append(file_info)
         
         return {
             'objectives': objectives_data,
             'files': synchronized_files,
             'total_spaces': len(objectives_data),
-            'collection_date': self.compilation_date.isoformat()
+            'collection_date': self._compilation_date_iso
         }
     
+    def _sync_space_objectives(self, space_name: str, objectives_file: Path) -> Optional[Tuple[Optional[Dict[str, Any]], Dict[str, Any]]]:
+        """Load one space's objectives.json, injecting spaceName if it is missing
+        
+        Returns None when the space has no objectives file, otherwise the parsed
+        objectives (None on failure) and the file's tracking entry.
+        """
+        try:
+            try:
+                raw = objectives_file.read_bytes()
+            except FileNotFoundError:
+                return None
+            objectives_content = json.loads(raw)
+            
+            # Inject spaceName if not present
+            if 'spaceName' not in objectives_content:
+                objectives_content['spaceName'] = space_name
+                
+                # Write back with spaceName injection, atomically
+                raw = json.dumps(objectives_content, indent=2, ensure_ascii=False).encode('utf-8')
+                temp_file = objectives_file.with_name(objectives_file.name + '.tmp')
+                temp_file.write_bytes(raw)
+                os.replace(temp_file, objectives_file)
+                
+                logger.info(f"Injected spaceName into {space_name}/objectives.json")
+            
+            stat_info = objectives_file.stat()
+            return objectives_content, {
+                'space': space_name,
+                'path': str(objectives_file),
+                'size': stat_info.st_size,
+                'modified': _fmt_ts(stat_info.st_mtime),
+                'hash': new_file_hash(raw).digest()[:8].hex(),  # Same truncation as _calculate_file_hash
+                'spaceName_injected': True,
+                'status': 'processed'
+            }
+            
+        except Exception as e:
+            logger.warning(f"Could not process objectives.json from {space_name}: {e}")
+            return None, {
+                'space': space_name,
+                'path': str(objectives_file),
+                'error': str(e),
+                'status': 'failed'
+            }
+    
     def _validate_data_exclusivity(self, data: Any) -> bool:
         """Validate that collected data is exclusive to HUMAN AI FRAMEWORK"""
         if not isinstance(data, dict):
             return True
         
-        # Check for any references to other spaces
-        prohibited_spaces = [
-            'general-space', 'shared-space', 'public-space', 
-            'common-infrastructure', 'cross-space'
-        ]
-        
-        data_str = json.dumps(data).lower()
-        
-        for prohibited in prohibited_spaces:
-            if prohibited in data_str:
-                logger.warning(f"Found prohibited space reference: {prohibited}")
+        # Check for any references to other spaces, stopping at the first hit
+        for text in _iter_strings(data):
+            match = PROHIBITED_SPACES_RE.search(text.lower())
+            if match:
+                logger.warning(f"Found prohibited space reference: {match.group()}")
                 return False
         
         return True
     
-    def _validate_log_framework_content(self, log_file: Path) -> bool:
-        """Validate that log file contains FRAMEWORK-specific content"""
-        try:
-            with open(log_file, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read(4096)  # Sample first 4KB
-            
-            # Must contain FRAMEWORK indicators
-            framework_indicators = [FRAMEWORK_SPACE.lower(), '[framework]', 'human-ai-framework']
-            
-            content_lower = content.lower()
-            return any(indicator in content_lower for indicator in framework_indicators)
-            
-        except Exception as e:
-            logger.warning(f"Could not validate log file {log_file}: {e}")
-            return False
+    def _validate_log_framework_content(self, sample: Optional[bytes]) -> bool:
+        """Validate that a log file sample contains FRAMEWORK-specific content"""
+        if sample is None:
+            return False  # Unreadable logs are excluded
+        
+        # Must contain FRAMEWORK indicators
+        content = sample.lower()
+        return any(indicator in content for indicator in FRAMEWORK_INDICATORS_BYTES)
     
-    def _validate_file_framework_content(self, file_path: Path) -> bool:
-        """Validate that file contains FRAMEWORK-specific content"""
-        try:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read(2048)  # Sample first 2KB
-            
-            # Check for FRAMEWORK-specific content
-            framework_content = content.lower()
-            return FRAMEWORK_SPACE.lower() in framework_content
-            
-        except Exception as e:
-            logger.debug(f"Could not validate file {file_path}: {e}")
+    def _validate_file_framework_content(self, sample: Optional[bytes]) -> bool:
+        """Validate that a file sample contains FRAMEWORK-specific content"""
+        if sample is None:
             return True  # Default to include if validation fails
+        
+        # Check for FRAMEWORK-specific content
+        return FRAMEWORK_SPACE_BYTES in sample.lower()
     
     def _calculate_file_hash(self, file_path: Path) -> str:
-        """Calculate SHA256 hash of file"""
-        hash_sha256 = hashlib.sha256()
+        """Calculate HASH_ALGORITHM hash of file"""
+        file_hash = new_file_hash()
         
         try:
             with open(file_path, 'rb') as f:
-                for chunk in iter(lambda: f.read(4096), b""):
-                    hash_sha256.update(chunk)
-            return hash_sha256.hexdigest()[:16]  # Truncate for storage
+                _update_hash_from_file(file_hash, f)
+            return file_hash.digest()[:8].hex()  # Truncate for storage
         except Exception as e:
             logger.warning(f"Could not hash file {file_path}: {e}")
             return "hash_failed"
@@ -558,19 +944,22 @@ class WeeklyCompiler:
         
         compilation_dir = COMPILATION_DIR / f"week-{self.week_id}"
         compilation_dir.mkdir(parents=True, exist_ok=True)
+        compilation_prefix = os.path.join(str(compilation_dir), '')
         
         # Create compilation manifest
         manifest = {
             'week_id': self.week_id,
-            'compilation_date': self.compilation_date.isoformat(),
+            'compilation_date': self._compilation_date_iso,
             'framework_space': FRAMEWORK_SPACE,
             'security_hash': self.security_manager.framework_hash,
+            'hash_algorithm': HASH_ALGORITHM,
             'data_sources': {},
             'exclusivity_verified': True
         }
         
         total_files = 0
         total_size = 0
+        tracked_files = []
         
         # Process each data source
         for source_name, source_data in data_sources.items():
@@ -579,6 +968,7 @@ class WeeklyCompiler:
                 source_dir.mkdir(exist_ok=True)
                 
                 copied_files = []
+                source_size = 0
                 
                 for file_info in source_data['files']:
                     # Skip files that had processing errors or are unchanged
@@ -593,43 +983,55 @@ class WeeklyCompiler:
                         
                     src_path = Path(file_info['path'])
                     
-                    if src_path.exists() and 'size' in file_info:
+                    if 'size' in file_info:
                         # Copy file to compilation directory
                         dst_path = source_dir / src_path.name
                         
                         # Skip if source and destination are the same
                         if src_path.resolve() == dst_path.resolve():
                             continue
-                            
-                        shutil.copy2(src_path, dst_path)
+                        
+                        # Files that vanished since collection surface here
+                        # instead of through a separate exists() check
+                        try:
+                            _fast_copy(src_path, dst_path)
+                        except (FileNotFoundError, PermissionError) as e:
+                            logger.warning(f"Could not copy {src_path}: {e}")
+                            continue
                         
                         copied_files.append({
                             'original_path': str(src_path),
-                            'compiled_path': str(dst_path.relative_to(compilation_dir)),
+                            'compiled_path': str(dst_path).removeprefix(compilation_prefix),
                             'size': file_info['size'],
                             'hash': file_info['hash']
                         })
                         
-                        total_files += 1
-                        total_size += file_info['size']
+                        tracked_files.append((
+                            self.week_id, str(src_path), file_info['hash'],
+                            file_info['size'], file_info['modified']
+                        ))
+                        
+                        source_size += file_info['size']
                 
                 manifest['data_sources'][source_name] = {
                     'files_count': len(copied_files),
-                    'total_size': sum(f['size'] for f in copied_files),
+                    'total_size': source_size,
                     'files': copied_files
                 }
+                total_files += len(copied_files)
+                total_size += source_size
         
         # Save manifest
         manifest_path = compilation_dir / 'manifest.json'
-        with open(manifest_path, 'w') as f:
-            json.dump(manifest, f, indent=2)
+        manifest_bytes = _dumps(manifest)
+        _write_compressed(manifest_path, manifest_bytes)
         
         # Create compilation checksum
-        compilation_checksum = self._calculate_compilation_checksum(compilation_dir)
+        compilation_checksum = self._calculate_compilation_checksum(manifest)
         
         # Update database
         self._update_compilation_database(
-            self.week_id, total_files, total_size, compilation_checksum, manifest
+            self.week_id, total_files, total_size, compilation_checksum, manifest_bytes, tracked_files
         )
         
         # Save audit log
@@ -644,50 +1046,56 @@ class WeeklyCompiler:
         
         return compilation_dir
     
-    def _calculate_compilation_checksum(self, compilation_dir: Path) -> str:
-        """Calculate checksum for entire compilation"""
+    def _calculate_compilation_checksum(self, manifest: Dict[str, Any]) -> str:
+        """Calculate checksum for entire compilation from the manifest's per-file hashes"""
         hash_sha256 = hashlib.sha256()
+        data_sources = manifest['data_sources']
         
-        for file_path in sorted(compilation_dir.rglob('*')):
-            if file_path.is_file():
-                hash_sha256.update(str(file_path.relative_to(compilation_dir)).encode())
-                
-                with open(file_path, 'rb') as f:
-                    for chunk in iter(lambda: f.read(4096), b""):
-                        hash_sha256.update(chunk)
+        for source_name in sorted(data_sources):
+            for file_info in sorted(data_sources[source_name]['files'], key=lambda f: f['compiled_path']):
+                hash_sha256.update(file_info['compiled_path'].encode())
+                hash_sha256.update(file_info['hash'].encode())
         
         return hash_sha256.hexdigest()
     
     def _update_compilation_database(self, week_id: str, files_count: int, 
-                                   total_size: int, checksum: str, manifest: Dict) -> None:
-        """Update compilation tracking database"""
-        
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute("""
-                INSERT OR REPLACE INTO compilations 
-                (week_id, compilation_date, files_processed, total_size_bytes, checksum, metadata)
-                VALUES (?, ?, ?, ?, ?, ?)
-            """, (
+                                   total_size: int, checksum: str, manifest_bytes: bytes,
+                                   tracked_files: List[tuple] = ()) -> None:
+        """Update compilation tracking database; the manifest is stored as a JSON BLOB"""
+        conn = self._get_connection()
+        with conn:
+            conn.execute(COMPILATION_INSERT_SQL, (
                 week_id,
-                self.compilation_date.isoformat(),
+                self._compilation_date_iso,
                 files_count,
                 total_size,
                 checksum,
-                json.dumps(manifest)
+                sqlite3.Binary(manifest_bytes)
             ))
+            self._record_tracked_files(week_id, tracked_files)
+    
+    def _record_tracked_files(self, week_id: str, file_rows: List[tuple]) -> None:
+        """Replace the files_tracked rows of a week; runs in the caller's transaction"""
+        conn = self._get_connection()
+        conn.execute("DELETE FROM files_tracked WHERE week_id = ?", (week_id,))
+        conn.executemany("""
+            INSERT INTO files_tracked
+            (week_id, file_path, file_hash, size_bytes, last_modified)
+            VALUES (?, ?, ?, ?, ?)
+        """, file_rows)
     
     def cleanup_old_compilations(self) -> None:
         """Remove compilations older than retention policy"""
         
         cutoff_date = self.compilation_date - timedelta(weeks=WEEKS_TO_RETAIN)
         
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.execute("""
-                SELECT week_id FROM compilations 
-                WHERE compilation_date < ?
-            """, (cutoff_date.isoformat(),))
-            
-            old_compilations = [row[0] for row in cursor.fetchall()]
+        conn = self._get_connection()
+        cursor = conn.execute("""
+            SELECT week_id FROM compilations 
+            WHERE compilation_date < ?
+        """, (cutoff_date.isoformat(),))
+        
+        old_compilations = [row[0] for row in cursor.fetchall()]
         
         for week_id in old_compilations:
             # Remove directory
@@ -695,13 +1103,14 @@ class WeeklyCompiler:
             if old_dir.exists():
                 shutil.rmtree(old_dir)
                 logger.info(f"Removed old compilation: {old_dir}")
-            
-            # Remove from database
-            with sqlite3.connect(self.db_path) as conn:
-                conn.execute("DELETE FROM files_tracked WHERE week_id = ?", (week_id,))
-                conn.execute("DELETE FROM compilations WHERE week_id = ?", (week_id,))
         
         if old_compilations:
+            # Remove from database in a single transaction
+            placeholders = ','.join('?' * len(old_compilations))
+            with conn:
+                conn.execute(f"DELETE FROM files_tracked WHERE week_id IN ({placeholders})", old_compilations)
+                conn.execute(f"DELETE FROM compilations WHERE week_id IN ({placeholders})", old_compilations)
+            
             logger.info(f"Cleaned up {len(old_compilations)} old compilations")
 
 def main():
@@ -709,6 +1118,7 @@ def main():
     
     # Get space name from environment
     space_name = os.getenv('SPACE_NAME', 'unknown')
+    compiler = None
     
     try:
         logger.info(f"Starting weekly compilation for space: {space_name}")
@@ -737,14 +1147,15 @@ def main():
             'week_id': compiler.week_id,
             'compilation_dir': str(compilation_dir),
             'space_verified': FRAMEWORK_SPACE,
-            'files_processed': sum(
-                len(data.get('files', [])) 
-                for data in data_sources.values() 
-                if isinstance(data, dict)
-            )
+            'files_processed': compiler.files_collected
         }
         
-        print(json.dumps(summary, indent=2))
+        if orjson is not None:
+            sys.stdout.flush()  # Keep ordering with log lines already written through sys.stdout
+            sys.stdout.buffer.write(orjson.dumps(summary, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE))
+            sys.stdout.buffer.flush()
+        else:
+            print(json.dumps(summary, indent=2))
         
     except PermissionError as e:
         logger.error(f"❌ Access denied: {e}")
@@ -753,6 +1164,10 @@ def main():
     except Exception as e:
         logger.error(f"💥 Weekly compilation failed: {e}")
         sys.exit(1)
+    
+    finally:
+        if compiler is not None:
+            compiler.close()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -1,40 +1,277 @@
 #!/usr/bin/env python3
-import json, glob, shutil, time, os, sys
-from jsonschema import validate, ValidationError
+import json, shutil, time, os, sys, atexit, hashlib, tarfile
+from concurrent.futures import ThreadPoolExecutor
+from jsonschema import ValidationError, validators
+
+try:
+    import fastjsonschema
+except ImportError:
+    fastjsonschema = None
+
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None  # Windows
+
+# Validation errors either schema library can raise; both carry .message
+_SCHEMA_ERRORS = (ValidationError,)
+if fastjsonschema is not None:
+    _SCHEMA_ERRORS += (fastjsonschema.JsonSchemaValueException,)
+
+# Linux reflink ioctl (exposed as fcntl.FICLONE from Python 3.12)
+FICLONE = getattr(fcntl, 'FICLONE', 0x40049409) if fcntl and sys.platform.startswith('linux') else None
 
 SPACE_DIR = os.path.dirname(__file__)
 SCHEMA_FILE = os.path.join(SPACE_DIR, 'config', 'copilot-schema.json')
 # Only validate config files, not package.json or other project files
-JSON_FILES = [f for f in glob.glob(os.path.join(SPACE_DIR, 'copilot', '*.json')) 
-              if not f.endswith('package.json') and not f.endswith('package-lock.json')]
+_EXCLUDED_SUFFIXES = ('package.json', 'package-lock.json')
+
+def _list_json_files(directory):
+    # One scandir pass with the same matches as glob('*.json') minus the exclusions,
+    # keeping regular files only (a directory or FIFO named *.json can't be validated)
+    try:
+        with os.scandir(directory) as entries:
+            return [e.path for e in entries
+                    if e.name.endswith('.json') and not e.name.startswith('.')
+                    and not e.name.endswith(_EXCLUDED_SUFFIXES) and e.is_file()]
+    except FileNotFoundError:
+        return []
+
+COPILOT_DIR = os.path.join(SPACE_DIR, 'copilot')
+JSON_FILES = _list_json_files(COPILOT_DIR)
+# Backup names are built per file, so join the directory part once
+_BACKUP_PREFIX = os.path.join(SPACE_DIR, 'backup-')
+
+AUDIT_LOG = os.path.join(SPACE_DIR, 'audit.log')
+AUDIT_BUFFER_SIZE = 128 * 1024
+# Audit messages are buffered and appended in one write, stamped with the
+# flush time (a run takes well under a second). The handle is opened on first
+# flush and kept for later main() calls; atexit covers sys.exit paths
+_audit_buffer = []
+_audit_handle = None
 
 def log_audit(message):
-    with open(os.path.join(SPACE_DIR,'audit.log'), 'a') as f:
-        f.write(f"{time.strftime('%Y-%m-%dT%H:%M:%S')} {message}\n")
+    _audit_buffer.append(message)
+
+def flush_audit():
+    global _audit_handle
+    if _audit_buffer:
+        if _audit_handle is None:
+            _audit_handle = open(AUDIT_LOG, 'ab', buffering=AUDIT_BUFFER_SIZE)
+        ts = time.strftime('%Y-%m-%dT%H:%M:%S')
+        _audit_handle.write(''.join(f"{ts} {message}\n" for message in _audit_buffer).encode())
+        _audit_handle.flush()
+        _audit_buffer.clear()
+
+def close_audit():
+    global _audit_handle
+    flush_audit()
+    if _audit_handle is not None:
+        _audit_handle.close()
+        _audit_handle = None
+
+atexit.register(close_audit)
+
+def _read_bytes(path):
+    # Whole-file read without a buffered file object
+    fd = os.open(path, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+    try:
+        return os.read(fd, os.fstat(fd).st_size)
+    finally:
+        os.close(fd)
+
+def _read_json(path):
+    return _loads(_read_bytes(path))
+
+CACHE_FILE = os.path.join(SPACE_DIR, '.verify_jsons.cache.json')
+
+def load_cache(schema_stamp):
+    # path -> [mtime_ns, size, sha1] of files that passed under this exact schema file
+    try:
+        cache = _read_json(CACHE_FILE)
+    except (OSError, ValueError):
+        return {}
+    return cache.get('files', {}) if cache.get('schema') == schema_stamp else {}
+
+def save_cache(schema_stamp, files):
+    tmp = CACHE_FILE + '.tmp'
+    with open(tmp, 'w') as f:
+        json.dump({'schema': schema_stamp, 'files': files}, f)
+    os.replace(tmp, CACHE_FILE)
+
+# Schema mtime -> (schema, validator, validation error type); lets repeated
+# main() calls in one process skip the parse and compile
+_SCHEMA_CACHE = {}
 
 def load_schema():
-    return json.load(open(SCHEMA_FILE))
+    mtime = os.path.getmtime(SCHEMA_FILE)
+    if mtime not in _SCHEMA_CACHE:
+        schema = _read_json(SCHEMA_FILE)
+        _SCHEMA_CACHE.clear()
+        _SCHEMA_CACHE[mtime] = (schema, *compile_validator(schema))
+    return _SCHEMA_CACHE[mtime]
 
-def backup(file):
+def compile_validator(schema):
+    # Build the validator once; returns (validate callable, its validation error type)
+    if fastjsonschema is not None:
+        return fastjsonschema.compile(schema, use_formats=False), fastjsonschema.JsonSchemaValueException
+    cls = validators.validator_for(schema)
+    cls.check_schema(schema)
+    return cls(schema).validate, ValidationError
+
+def backup(file, timestamp=None):
     base = os.path.basename(file)
-    timestamp = time.strftime('%Y%m%d%H%M%S')
-    bak = os.path.join(SPACE_DIR, f"backup-{base}-{timestamp}.json")
+    timestamp = timestamp or time.strftime('%Y%m%d%H%M%S')
+    bak = f"{_BACKUP_PREFIX}{base}-{timestamp}.json"
+    # A reflink shares blocks copy-on-write, so later edits to the source
+    # can't leak into the backup (unlike a hardlink)
+    if FICLONE is not None:
+        try:
+            with open(file, 'rb') as src, open(bak, 'wb') as dst:
+                fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+            shutil.copymode(file, bak)
+            return bak
+        except OSError:
+            pass  # No reflink support here; copy the bytes instead
     shutil.copy(file, bak)
     return bak
 
-def main():
-    schema = load_schema()
-    for jf in JSON_FILES:
-        data = json.load(open(jf))
+BACKUP_INDEX = os.path.join(SPACE_DIR, '.backup-index.json')
+
+def _new_tarball(timestamp):
+    # Runs in the same second share a timestamp; never overwrite an earlier
+    # run's tarball, since the backup index still points into it
+    tar_path = f"{_BACKUP_PREFIX}{timestamp}.tar"
+    counter = 0
+    while True:
         try:
-            validate(instance=data, schema=schema)
-        except ValidationError as e:
-            print(f"Schema validation error in {jf}: {e.message}")
-            sys.exit(1)
-        bak = backup(jf)
-        log_audit(f"Validated & backed up {jf} -> {bak}")
-    print("All JSON files validated and backed up.")
-    log_audit("verify_jsons.py completed successfully.")
+            return tarfile.open(tar_path, 'x'), tar_path
+        except FileExistsError:
+            counter += 1
+            tar_path = f"{_BACKUP_PREFIX}{timestamp}-{counter}.tar"
+
+def _backup_exists(path, ref, members):
+    # Tarball references also need their member; each tarball's names are read once
+    if not os.path.exists(path):
+        return False
+    if ref == path:
+        return True
+    if path not in members:
+        try:
+            with tarfile.open(path) as tar:
+                members[path] = set(tar.getnames())
+        except (OSError, tarfile.TarError):
+            members[path] = set()
+    return ref[len(path) + 1:] in members[path]
+
+def backup_all(files, digests, timestamp):
+    # One tarball per run: a single new inode instead of one backup file per config.
+    # Files whose digest matches their latest backup in BACKUP_INDEX are not backed
+    # up again. Returns (backup reference, backed up this run) per file; the reference
+    # is "<tarball>:<member>", or the per-file copy if the tarball can't be written
+    try:
+        index = _read_json(BACKUP_INDEX)  # basename -> [backup path, reference, digest]
+    except (OSError, ValueError):
+        index = {}
+    refs = {}  # file -> (reference, backed up this run)
+    pending = []
+    members = {}
+    for file, digest in zip(files, digests):
+        base = os.path.basename(file)
+        latest = index.get(base)
+        if latest and latest[2] == digest and _backup_exists(latest[0], latest[1], members):
+            refs[file] = (latest[1], False)
+        else:
+            pending.append((file, base, digest))
+    if pending:
+        try:
+            tar, tar_path = _new_tarball(timestamp)
+            with tar:
+                for file, base, _ in pending:
+                    tar.add(file, arcname=base)
+            written = [(tar_path, f"{tar_path}:{base}") for _, base, _ in pending]
+        except OSError:
+            written = [(bak, bak) for bak in (backup(file, timestamp) for file, _, _ in pending)]
+        for (file, base, digest), (path, ref) in zip(pending, written):
+            refs[file] = (ref, True)
+            index[base] = [path, ref, digest]
+        tmp = BACKUP_INDEX + '.tmp'
+        with open(tmp, 'w') as f:
+            json.dump(index, f)
+        os.replace(tmp, BACKUP_INDEX)
+    return [refs[file] for file in files]
+
+def check(jf, validator, schema_error, cache):
+    # (None, cache entry) if valid, else (schema error message or exception to re-raise, None).
+    # Files unchanged since they last passed skip the schema check; the SHA-1
+    # is only computed when mtime or size moved
+    try:
+        st = os.stat(jf)
+        previous = cache.get(jf)
+        if previous and previous[:2] == [st.st_mtime_ns, st.st_size]:
+            return None, previous
+        raw = _read_bytes(jf)
+        digest = hashlib.sha1(raw).hexdigest()
+        if not (previous and previous[2] == digest):
+            validator(_loads(raw))
+        return None, [st.st_mtime_ns, st.st_size, digest]
+    except schema_error as e:
+        return f"Schema validation error in {jf}: {e.message}", None
+    except Exception as e:
+        return e, None
+
+def main(validator=None, schema_error=None):
+    # The pass cache is only trusted for the schema file's own validator
+    schema_stamp = None
+    if validator is None:
+        _, validator, schema_error = load_schema()
+        st = os.stat(SCHEMA_FILE)
+        schema_stamp = [st.st_mtime_ns, st.st_size]
+    elif schema_error is None:
+        schema_error = _SCHEMA_ERRORS
+    cache = load_cache(schema_stamp) if schema_stamp else {}
+    run_ts = time.strftime('%Y%m%d%H%M%S')  # One backup suffix for the whole run
+    # Validate everything concurrently, then back up only the files before the
+    # first failure, as the sequential fail-fast loop did
+    with ThreadPoolExecutor(max_workers=min(32, len(JSON_FILES) or 1)) as ex:
+        results = list(ex.map(lambda jf: check(jf, validator, schema_error, cache), JSON_FILES))
+        failed = next((i for i, (r, _) in enumerate(results) if r is not None), len(JSON_FILES))
+    # Flush on every way out, so callers that catch SystemExit still find the
+    # audit lines on disk without waiting for atexit
+    try:
+        # check() already hashed each valid file's bytes; that digest keys the backup index
+        baks = backup_all(JSON_FILES[:failed], [entry[2] for _, entry in results[:failed]], run_ts)
+        if schema_stamp:
+            save_cache(schema_stamp, {jf: entry for jf, (_, entry) in zip(JSON_FILES, results) if entry})
+        for jf, (bak, backed_up) in zip(JSON_FILES, baks):
+            if backed_up:
+                log_audit(f"Validated & backed up {jf} -> {bak}")
+            else:
+                log_audit(f"Validated (backup unchanged) {jf} -> {bak}")
+        if failed < len(JSON_FILES):
+            error = results[failed][0]
+            if isinstance(error, Exception):
+                raise error
+            print(error)
+            raise SystemExit(1)
+        print("All JSON files validated and backed up.")
+        log_audit("verify_jsons.py completed successfully.")
+    finally:
+        flush_audit()
+        sys.stdout.flush()
 
 if __name__=="__main__":
-    main()
\ No newline at end of file
+    main()
+    # Success: everything is written once stdio and the audit log are flushed,
+    # so skip interpreter teardown. Error paths raise and run handlers normally
+    sys.stdout.flush()
+    sys.stderr.flush()
+    close_audit()
+    if not sys.flags.inspect:
+        os._exit(0)
\ No newline at end of file